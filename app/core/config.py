@@ -35,6 +35,16 @@ class Settings(BaseSettings):
     LLM_CONNECT_TIMEOUT_SECONDS: int = int(os.getenv("LLM_CONNECT_TIMEOUT_SECONDS", "10"))
     LLM_MAX_RETRIES: int = int(os.getenv("LLM_MAX_RETRIES", "3"))
     LLM_RETRY_BASE_DELAY: float = float(os.getenv("LLM_RETRY_BASE_DELAY", "1.0"))
+    LLM_MAX_CONCURRENCY: int = int(os.getenv("LLM_MAX_CONCURRENCY", "20"))
+    # Log every httpx/httpcore request event at DEBUG level, for troubleshooting connection issues
+    LLM_DEBUG_HTTP: bool = os.getenv("LLM_DEBUG_HTTP", "false").lower() == "true"
+    # Stop waiting for slower providers once two providers agree on a top-3 competitor
+    COMPETITOR_EARLY_EXIT: bool = os.getenv("COMPETITOR_EARLY_EXIT", "false").lower() == "true"
+    
+    # Scraping cache configuration
+    SCRAPE_CACHE_DIR: str = os.getenv("SCRAPE_CACHE_DIR", "/tmp/aeo_facts")
+    SCRAPE_CACHE_SIZE_LIMIT_BYTES: int = int(os.getenv("SCRAPE_CACHE_SIZE_LIMIT_BYTES", str(500 * 1024 * 1024)))
+    SCRAPE_CACHE_TTL_SECONDS: int = int(os.getenv("SCRAPE_CACHE_TTL_SECONDS", "86400"))
     
     # Production Stripe Variables
     STRIPE_SECRET_KEY_PROD: str = os.getenv("STRIPE_SECRET_KEY_PROD", "")
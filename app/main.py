@@ -1,8 +1,20 @@
 import uvicorn
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from app.api.api import api_router
 from app.core.config import settings
+from app.services.analysis.utils.http_utils import close_http_client
+from app.services.analysis.utils.llm_utils import close_llm_clients
+from app.services.analysis.utils.scrape_utils import close_company_facts_cache
+
+@asynccontextmanager
+async def lifespan(application: FastAPI):
+    """Release shared resources when the application shuts down"""
+    yield
+    await close_llm_clients()
+    await close_http_client()
+    close_company_facts_cache()
 
 def create_application() -> FastAPI:
     """Create the FastAPI application with all configurations"""
@@ -11,6 +23,7 @@ def create_application() -> FastAPI:
         openapi_url=f"{settings.API_V1_STR}/openapi.json",
         docs_url="/docs",
         redoc_url="/redoc",
+        lifespan=lifespan,
     )
 
     # Set up CORS
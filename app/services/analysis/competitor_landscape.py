@@ -8,7 +8,12 @@ from app.core.config import settings
 from app.core.constants import PROVIDER_MODELS, MODEL_FIELD_MAPPING
 import asyncio
 import ast
-from app.services.analysis.utils.llm_utils import query_openai, query_anthropic, query_gemini, query_perplexity
+from app.services.analysis.utils.llm_utils import (
+    query_openai,
+    query_anthropic,
+    query_gemini,
+    query_perplexity
+)
 from collections import Counter
 import re
 from app.schemas.analysis import (
@@ -21,14 +26,28 @@ from app.schemas.analysis import (
 )
 import json
 
+# Structured-output schema for providers that support it; the response is then
+# {"competitors": [...]} instead of free-form text
+COMPETITORS_JSON_SCHEMA = {
+    "name": "return_competitors",
+    "schema": {
+        "type": "object",
+        "properties": {
+            "competitors": {"type": "array", "items": {"type": "string"}}
+        },
+        "required": ["competitors"],
+        "additionalProperties": False
+    }
+}
+
 class CompetitorLandscapeAnalyzer(BaseAnalyzer):
     """Analyzer for evaluating competitive landscape of a company."""
     
     @staticmethod
-    async def _query_llms_competitors(company_facts: dict) -> dict:
+    def _build_competitors_prompt(company_facts: dict) -> str:
         """
-        Query multiple LLMs for the top 3 competitors in the given industry/product.
-        Returns a dict of provider -> model -> list of competitors (or error string).
+        Build the "top companies" prompt from the company's industry and products.
+        Returns an empty string when neither is known.
         """
         industry = company_facts.get("industry", "") or ""
         products = company_facts.get("key_products_services", [])
@@ -36,24 +55,33 @@ class CompetitorLandscapeAnalyzer(BaseAnalyzer):
         company_name = company_facts.get("name", "").lower()
         count = 4 if company_name == "aeo checker" else 5
 
-        responses = {}
-
         if industry and products_string:
-            prompt = (
+            return (
                 f"List the top {count} companies in the {industry} industry for {products_string}. "
                 "Return only a Python array of company names, e.g., ['Company1', 'Company2', 'Company3', 'Company4', 'Company5']. Only return the list, no other text. Do not provide any reasononing for your choices, do not provide any thought process, ONLY provide the array"
             )
         elif industry and not products_string: 
-            prompt = (
+            return (
                 f"List the top {count} companies in the {industry} industry. "
                 "Return only a Python array of company names, e.g., ['Company1', 'Company2', 'Company3', 'Company4', 'Company5']. Only return the list, no other text. Do not provide any reasononing for your choices, do not provide any thought process, ONLY provide the array"
             )
         elif not industry and products_string: 
-            prompt = (
+            return (
                 f"List the top {count} companies in the {products_string} product. "
                 "Return only a Python array of company names, e.g., ['Company1', 'Company2', 'Company3', 'Company4', 'Company5']. Only return the list, no other text. Do not provide any reasononing for your choices, do not provide any thought process, ONLY provide the array"
             )
-        else: 
+        return ""
+
+    @staticmethod
+    async def _query_llms_competitors(company_facts: dict) -> dict:
+        """
+        Query multiple LLMs for the top 3 competitors in the given industry/product.
+        Returns a dict of provider -> model -> list of competitors (or error string).
+        """
+        responses = {}
+
+        prompt = CompetitorLandscapeAnalyzer._build_competitors_prompt(company_facts)
+        if not prompt:
             print("No industry or product found/provided, skipping competitor analysis")
             return {}
 
@@ -63,7 +91,7 @@ class CompetitorLandscapeAnalyzer(BaseAnalyzer):
         # OpenAI models
         if settings.OPENAI_API_KEY:
             for model in PROVIDER_MODELS["openai"]:
-                tasks.append(query_openai(prompt, model))
+                tasks.append(query_openai(prompt, model, json_schema=COMPETITORS_JSON_SCHEMA))
                 task_info.append(("openai", model))
         else:
             print("OpenAI API key not configured")
@@ -75,7 +103,7 @@ class CompetitorLandscapeAnalyzer(BaseAnalyzer):
         # Anthropic models
         if settings.ANTHROPIC_API_KEY:
             for model in PROVIDER_MODELS["anthropic"]:
-                tasks.append(query_anthropic(prompt, model))
+                tasks.append(query_anthropic(prompt, model, json_schema=COMPETITORS_JSON_SCHEMA))
                 task_info.append(("anthropic", model))
         else:
             print("Anthropic API key not configured")
@@ -87,6 +115,7 @@ class CompetitorLandscapeAnalyzer(BaseAnalyzer):
         # Gemini models
         if settings.GEMINI_API_KEY:
             for model in PROVIDER_MODELS["gemini"]:
+                # No response schema here: Gemini's google_search grounding does not support it
                 tasks.append(query_gemini(prompt, model))
                 task_info.append(("gemini", model))
         else:
@@ -99,7 +128,7 @@ class CompetitorLandscapeAnalyzer(BaseAnalyzer):
         # Perplexity models
         if settings.PERPLEXITY_API_KEY:
             for model in PROVIDER_MODELS["perplexity"]:
-                tasks.append(query_perplexity(prompt, model))
+                tasks.append(query_perplexity(prompt, model, json_schema=COMPETITORS_JSON_SCHEMA))
                 task_info.append(("perplexity", model))
         else:
             print("Perplexity API key not configured")
@@ -110,11 +139,18 @@ class CompetitorLandscapeAnalyzer(BaseAnalyzer):
         
         # Execute all tasks
         if tasks:
-            results = await asyncio.gather(*tasks, return_exceptions=True)
+            if settings.COMPETITOR_EARLY_EXIT:
+                results = await CompetitorLandscapeAnalyzer._gather_until_consensus(tasks, [provider for provider, _ in task_info])
+            else:
+                results = await asyncio.gather(*tasks, return_exceptions=True)
             for i, result in enumerate(results):
                 provider, model = task_info[i]
                 field_name = MODEL_FIELD_MAPPING[model]
                 
+                # Cancelled after an early consensus: leave the model out rather than scoring it as 0
+                if result is None:
+                    continue
+                
                 if provider not in responses:
                     responses[provider] = {}
                 
@@ -126,11 +162,52 @@ class CompetitorLandscapeAnalyzer(BaseAnalyzer):
         
         return responses
 
+    @staticmethod
+    async def _gather_until_consensus(coros: list, providers: list, min_providers: int = 2) -> list:
+        """
+        Like asyncio.gather(..., return_exceptions=True), but stops as soon as one competitor
+        appears in the top 3 of at least min_providers different providers, cancelling the
+        queries still running. Results of cancelled queries are None.
+        """
+        tasks = [asyncio.ensure_future(coro) for coro in coros]
+        task_index = {task: i for i, task in enumerate(tasks)}
+        results = [None] * len(tasks)
+        completed = {}  # provider -> task index -> response text, in the llm_responses shape
+        pending = set(tasks)
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    i = task_index[task]
+                    if task.exception() is not None:
+                        results[i] = task.exception()
+                        continue
+                    results[i] = task.result()
+                    completed.setdefault(providers[i], {})[i] = results[i][1]
+                
+                _, ranked = CompetitorLandscapeAnalyzer._tally(completed)
+                if ranked and ranked[0][1] >= min_providers:
+                    break
+        finally:
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+        
+        return results
+
     @staticmethod
     def _parse_competitor_list(response: str) -> list:
         """Parse various formats of competitor lists from LLM responses."""
         try:
-            # First try literal_eval (for clean Python lists)
+            # Structured-output providers return {"competitors": [...]}, which needs no regex fallbacks
+            try:
+                parsed = json.loads(response)
+                if isinstance(parsed, dict) and isinstance(parsed.get("competitors"), list):
+                    return [comp.strip() for comp in parsed["competitors"] if isinstance(comp, str) and comp.strip()][:5]
+            except ValueError:
+                pass
+            
+            # Then try literal_eval (for clean Python lists)
             try:
                 competitors = ast.literal_eval(response.strip())
                 if isinstance(competitors, list):
@@ -211,21 +288,20 @@ class CompetitorLandscapeAnalyzer(BaseAnalyzer):
         
         return []
 
-    def _normalize_company_name(self, name: str) -> str:
+    @staticmethod
+    def _strip_company_suffixes(name: str) -> str:
         """
-        Normalize company name for comparison by:
-        - Converting to lowercase
-        - Removing spaces, dashes, periods, and special characters
-        - Removing common suffixes like Inc, Corp, Group, etc.
+        Lowercase a company name and remove a trailing domain extension and common
+        suffixes like Inc, Corp, Group, etc., keeping its spaces and punctuation.
         """
         if not name:
             return ""
             
         # Convert to lowercase
-        normalized = name.lower()
+        stripped = name.lower().strip()
         
         # Remove common domain extensions
-        normalized = re.sub(r'\.com$|\.org$|\.net$|\.co$', '', normalized)
+        stripped = re.sub(r'\.com$|\.org$|\.net$|\.co$', '', stripped)
         
         # Remove common business suffixes (must be at the end of the name)
         suffixes = [
@@ -234,21 +310,31 @@ class CompetitorLandscapeAnalyzer(BaseAnalyzer):
             r'\s+limited$', r'\s+llc$', r'\s+co\.?$', r'\s+&\s+co\.?$', r'\s+original$', r'\s+originals$'
         ]
         for suffix in suffixes:
-            normalized = re.sub(suffix, '', normalized)
+            stripped = re.sub(suffix, '', stripped)
+        
+        return stripped
+
+    @staticmethod
+    def _normalize_company_name(name: str) -> str:
+        """
+        Normalize company name for comparison by:
+        - Converting to lowercase
+        - Removing common suffixes like Inc, Corp, Group, etc.
+        - Removing spaces, dashes, periods, and special characters
+        """
+        normalized = CompetitorLandscapeAnalyzer._strip_company_suffixes(name)
         
         # Remove all spaces, dashes, periods, and special characters
         normalized = re.sub(r'[\s\-\.\,\'\"\(\)\&]', '', normalized)
         
         return normalized.strip()
 
-    def _should_group_companies(self, name1: str, name2: str) -> bool:
+    @staticmethod
+    def _should_group_normalized(norm1: str, norm2: str) -> bool:
         """
-        Determine if two company names should be grouped together.
-        Uses normalized names and checks if one is a substring of the other.
+        Determine if two normalized company names should be grouped together:
+        equal, or one a substring of the other.
         """
-        norm1 = self._normalize_company_name(name1)
-        norm2 = self._normalize_company_name(name2)
-        
         if not norm1 or not norm2:
             return False
             
@@ -263,65 +349,53 @@ class CompetitorLandscapeAnalyzer(BaseAnalyzer):
         
         return False
 
-    def _count_and_rank_competitors(self, competitors_lists: list) -> list:
-        """Count and rank competitors based on frequency of mentions, grouping similar names."""
-        # First pass: collect all competitors and group similar ones
-        competitor_groups = []  # List of lists, each sublist contains similar company names
-        all_competitors = []
-        
-        # Flatten all competitor lists
-        for lst in competitors_lists:
-            all_competitors.extend(lst)
-        
-        # Group similar competitors
-        for comp in all_competitors:
-            comp = comp.strip()
-            if not comp:
-                continue
-                
-            # Find if this competitor should be grouped with an existing group
-            grouped = False
-            for group in competitor_groups:
-                # Check if current competitor should be grouped with any competitor in this group
-                if any(self._should_group_companies(comp, existing_comp) for existing_comp in group):
-                    group.append(comp)
-                    grouped = True
-                    break
-            
-            # If not grouped, create a new group
-            if not grouped:
-                competitor_groups.append([comp])
-        
-        # Second pass: count occurrences and select representative name for each group
-        group_counts = []
-        for group in competitor_groups:
-            count = len(group)
-            
-            # Select the most common original name in the group, or shortest if tied
-            name_counter = Counter(group)
-            most_common_names = name_counter.most_common()
-            
-            # If there's a tie in frequency, prefer the shortest name
-            max_count = most_common_names[0][1]
-            candidates = [name for name, freq in most_common_names if freq == max_count]
-            representative_name = min(candidates, key=len)  # Shortest name among most frequent
-            
-            group_counts.append((representative_name, count))
-        
-        # Sort by count (descending)
-        ranked_competitors = sorted(group_counts, key=lambda x: x[1], reverse=True)
+    @staticmethod
+    def _tally(llm_responses: dict, top_n: int = 3) -> tuple:
+        """
+        Count, for each group of similar competitor names, how many providers list it in their top_n.
+        Names are grouped with _should_group_normalized, so "Acme", "Acme Inc." and "Acme Cloud"
+        are one competitor. Takes the provider -> model -> response text dict from
+        _query_llms_competitors and returns (Counter, most_common list) keyed by each group's
+        first normalized name; errors and unconfigured models are skipped.
+        """
+        groups = []  # (normalized names, providers) per group, in first-seen order
+        for provider, model_responses in llm_responses.items():
+            for response in model_responses.values():
+                if not isinstance(response, str) or response.startswith("Error:") or response == "API key not configured":
+                    continue
+                for competitor in CompetitorLandscapeAnalyzer._parse_competitor_list(response)[:top_n]:
+                    norm = CompetitorLandscapeAnalyzer._normalize_company_name(competitor)
+                    if not norm:
+                        continue
+                    for group_norms, group_providers in groups:
+                        if any(CompetitorLandscapeAnalyzer._should_group_normalized(norm, existing_norm) for existing_norm in group_norms):
+                            if norm not in group_norms:
+                                group_norms.append(norm)
+                            group_providers.add(provider)
+                            break
+                    else:
+                        groups.append(([norm], {provider}))
         
-        return ranked_competitors
+        counter = Counter({group_norms[0]: len(group_providers) for group_norms, group_providers in groups})
+        return counter, counter.most_common()
 
     def _calculate_score(self, competitors_list: list, company_name: str) -> tuple:
         """Calculate score based on company's position in the competitor list."""
         score = 0
         included = False
-        normalized_company_name = company_name.lower()
+        # Equal normalized names match, so "Acme Inc." still matches a competitor listed as "Acme"
+        normalized_company_name = self._normalize_company_name(company_name)
+        if not normalized_company_name:
+            return score, included
+        # Otherwise the name must appear as whole words, so "Acme" matches "Acme Cloud (acme.io)"
+        # but a short name like "X Corp" does not match every competitor containing an "x"
+        company_words = self._strip_company_suffixes(company_name).strip(" ,.-'\"()&")
+        company_words_re = re.compile(r'(?<!\w)' + re.escape(company_words) + r'(?!\w)')
 
         # Find the company in the list and get its position
         for position, competitor in enumerate(competitors_list):
-            if competitor.lower() == normalized_company_name or normalized_company_name in competitor.lower():
+            if (self._normalize_company_name(competitor) == normalized_company_name
+                    or company_words_re.search(competitor.lower())):
                 included = True
                 # Position-based scoring (0-indexed, so add 1 for actual position)
                 # Scaled up so max score is 100 per model
@@ -377,7 +451,14 @@ class CompetitorLandscapeAnalyzer(BaseAnalyzer):
 
         print(json.dumps(llm_responses, indent=4))
 
-        # 2. Process each LLM response individually
+        # 2. Score each LLM response individually
+        return self._score_llm_responses(llm_responses, company_facts)
+
+    def _score_llm_responses(self, llm_responses: dict, company_facts: dict) -> tuple:
+        """
+        Turn provider -> model -> raw response text into the final score and
+        CompetitorLandscapeResult.
+        """
         provider_results = {}
         total_score = 0
         valid_responses = 0
@@ -446,4 +527,4 @@ class CompetitorLandscapeAnalyzer(BaseAnalyzer):
             score=final_score
         )
 
-        return final_score, final_result
\ No newline at end of file
+        return final_score, final_result
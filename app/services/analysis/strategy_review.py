@@ -3,21 +3,251 @@ Strategy Review Analyzer module.
 This module contains functionality to analyze a company's strategic positioning.
 """
 
-from typing import Dict, Any, Tuple, List, Set
+from typing import Dict, Any, Tuple, List, Set, Iterator, Optional
 from bs4 import BeautifulSoup
+import lxml.etree
+import lxml.html
 import httpx
+from async_lru import alru_cache
+from cachetools import LRUCache, TTLCache
 import json
 import re
 import asyncio
-from datetime import datetime, timedelta
+import threading
+import copy
+import hashlib
+from bisect import bisect_left
+from collections import Counter
+from itertools import accumulate
+from dataclasses import dataclass, field, asdict
+from datetime import datetime
 from urllib.parse import urlparse, urlunparse, urljoin
 from app.services.analysis.base import BaseAnalyzer
 from app.core.config import settings
 from langdetect import detect, LangDetectException
-from app.services.analysis.utils.scrape_utils import ( check_robots_txt, get_potential_sitemap_urls, is_valid_sitemap )
+from app.services.analysis.utils.scrape_utils import ( check_robots_txt, file_exists, get_potential_sitemap_urls, has_valid_sitemap )
 from app.services.analysis.utils.reddit_utils import log_scale, exp_decay
+from app.services.analysis.utils.http_utils import get_http_client
 from app.schemas.analysis import RedditResult
 
+# orjson imports for faster JSON-LD parsing
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# pyahocorasick imports for matching all citation terms in one pass
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+# Phrase patterns for content answerability, compiled once with each category merged into a single alternation.
+# The conversational and statistic patterns are case-insensitive, so phrases are matched without lowercasing them
+CONVERSATIONAL_PHRASE_RE = re.compile(r'\byes\b|\bno\b|how do (?:i|you|we)|how can (?:i|you|we)|what (?:is|are|should)|when (?:should|can|do)', re.IGNORECASE)
+STATISTIC_PHRASE_RE = re.compile(r'\d+\s*(?:%|percent|million|billion|thousand)|[£$€¥]\s*\d+|\b(?:quarter|half|third)\b', re.IGNORECASE)
+CITATION_PHRASE_RE = re.compile(r'[\'"][^\'"]+[\'"]|\[[0-9]+\]|\([^)]*\d{4}[^)]*\)')
+# Citation pattern for phrases joined with NUL separators: the character classes exclude NUL,
+# so no match can span two phrases. The conversational and statistic patterns cannot match NUL as is
+JOINED_CITATION_PHRASE_RE = re.compile(r'[\'"][^\'"\x00]+[\'"]|\[[0-9]+\]|\([^)\x00]*\d{4}[^)\x00]*\)')
+PHRASE_SEPARATOR_RE = re.compile(r'(?<=[.!?])\s+')
+# Script src hints that the page is rendered client-side by a JS framework
+JS_FRAMEWORK_SRC_RE = re.compile(r'(react|angular|vue|next|nuxt|svelte)', re.IGNORECASE)
+# Separates the primary language subtag in an <html lang="..."> value such as en-US or pt_BR
+HTML_LANG_SEPARATOR_RE = re.compile(r'[-_]')
+# Characters of body text sampled for language detection
+LANGUAGE_SAMPLE_LENGTH = 2000
+GOOD_PHRASE_MIN_LENGTH = 70
+GOOD_PHRASE_MAX_LENGTH = 180
+
+# Terms that mark a citations/references section in headings, ids and classes
+CITATION_TERMS = ('citations', 'references', 'sources', 'bibliography', 'reference list', 'citation list', 'bibliography list')
+# Case-insensitive, so element text is searched without lowercasing it first
+CITATION_TERMS_RE = re.compile('|'.join(re.escape(term) for term in CITATION_TERMS), re.IGNORECASE)
+if AHOCORASICK_AVAILABLE:
+    CITATION_TERMS_AUTOMATON = ahocorasick.Automaton()
+    for _term in CITATION_TERMS:
+        CITATION_TERMS_AUTOMATON.add_word(_term, _term)
+    CITATION_TERMS_AUTOMATON.make_automaton()
+
+def _has_citation_term(text: str) -> bool:
+    """Return True if the text contains any citation term, ignoring case."""
+    if AHOCORASICK_AVAILABLE:
+        return next(CITATION_TERMS_AUTOMATON.iter(text.lower()), None) is not None
+    return CITATION_TERMS_RE.search(text) is not None
+
+# Tags that carry meaning for the semantic HTML ratio, versus generic containers
+SEMANTIC_TAGS = frozenset({
+    'header', 'footer', 'nav', 'main', 'article', 'aside', 'section',
+    'details', 'summary', 'figure', 'figcaption', 'time', 'mark',
+    'h1', 'h2', 'h3', 'h4', 'h5', 'h6',  # Headings have semantic meaning
+    'address', 'blockquote', 'cite', 'q', 'ul', 'ol', 'li', 'dl', 'dt', 'dd'  # Lists & definition lists
+})
+NON_SEMANTIC_TAGS = frozenset({'div', 'span'})  # Primary non-semantic containers
+
+def _loads_json_ld(text: str) -> Any:
+    """
+    Parse a JSON-LD script body, using orjson when installed. orjson is stricter than json
+    (no NaN/Infinity, no integers beyond 64 bits), so anything it rejects gets a second try
+    with json; only a json error reaches the caller.
+    """
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.loads(text)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(text)
+
+@dataclass(slots=True)
+class AnswerabilityCounts:
+    """Phrase counters for content answerability; asdict() gives the result payload."""
+    total_phrases: int = 0
+    is_good_length_phrase: int = 0
+    is_conversational_phrase: int = 0
+    has_statistics_phrase: int = 0
+    has_citation_phrase: int = 0
+    has_citations_section: bool = False
+    score: float = 0.0
+
+@dataclass(slots=True)
+class SemanticElements:
+    """Semantic HTML statistics for the structured data analysis."""
+    present: bool = False
+    unique_types_found: list = field(default_factory=list)
+    count_unique_types: int = 0
+    all_tags_count: int = 0
+    semantic_tags_count: int = 0
+    non_semantic_tags_count: int = 0
+    semantic_ratio: float = 0.0
+
+@dataclass(slots=True)
+class StructuredDataFindings:
+    """Structured data findings; asdict() gives the result payload, including the nested elements."""
+    schema_markup_present: bool = False
+    schema_types_found: list = field(default_factory=list)
+    specific_schemas: dict = field(default_factory=lambda: {"FAQPage": False, "Article": False, "Review": False})
+    semantic_elements: SemanticElements = field(default_factory=SemanticElements)
+    score: float = 0.0
+
+# Schema.org types that count towards each important schema category
+SCHEMA_TYPE_MAPPINGS = {
+    "FAQPage": {"FAQPage"},
+    "Article": {"Article", "NewsArticle", "BlogPosting", "TechArticle", "Report"},
+    "Review": {"Review", "AggregateRating", "Rating"},
+    "Product": {"Product", "IndividualProduct", "ProductModel"},
+    "Organization": {"Organization", "Corporation", "NGO", "GovernmentOrganization", "EducationalOrganization"},
+    "LocalBusiness": {"LocalBusiness", "Restaurant", "Store", "AutoDealer", "Dentist", "Hospital", "LegalService", "RealEstateAgent"},
+    "Person": {"Person"},
+    "Event": {"Event", "BusinessEvent", "ChildrensEvent", "ComedyEvent", "CourseInstance", "DanceEvent", "DeliveryEvent", "EducationEvent", "ExhibitionEvent", "Festival", "FoodEvent", "LiteraryEvent", "MusicEvent", "PublicationEvent", "SaleEvent", "ScreeningEvent", "SocialEvent", "SportsEvent", "TheaterEvent", "VisualArtsEvent"},
+    "Recipe": {"Recipe"},
+    "Service": {"Service", "FinancialService", "FoodService", "GovernmentService", "TaxiService"},
+    "WebPage": {"WebPage", "AboutPage", "CheckoutPage", "CollectionPage", "ContactPage", "FAQPage", "ItemPage", "MedicalWebPage", "ProfilePage", "QAPage", "RealEstateListing", "SearchResultsPage"},
+    "BreadcrumbList": {"BreadcrumbList"},
+    "VideoObject": {"VideoObject", "Movie", "TVSeries", "TVEpisode"},
+    "ImageObject": {"ImageObject", "Photograph"},
+    "Course": {"Course", "CourseInstance"},
+    "JobPosting": {"JobPosting"},
+    "HowTo": {"HowTo", "Recipe"},
+    "Dataset": {"Dataset"},
+    "SoftwareApplication": {"SoftwareApplication", "MobileApplication", "WebApplication", "VideoGame"}
+}
+
+def _collect_schema_types(data: Any) -> Set[str]:
+    """
+    Return every @type string found anywhere in a parsed JSON-LD document.
+    @type may be a string or a list of strings; the walk is iterative so deeply nested
+    documents cannot hit the recursion limit.
+    """
+    schema_types = set()
+    stack = [data]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, dict):
+            schema_type = node.get("@type")
+            if isinstance(schema_type, str):
+                schema_types.add(schema_type)
+            elif isinstance(schema_type, list):
+                schema_types.update(t for t in schema_type if isinstance(t, str))
+            stack.extend(value for value in node.values() if isinstance(value, (dict, list)))
+        elif isinstance(node, list):
+            stack.extend(value for value in node if isinstance(value, (dict, list)))
+    return schema_types
+
+def _index_schema_types_by_lowercase(mappings: Dict[str, Set[str]]) -> Dict[str, Tuple[str, ...]]:
+    """Invert the category -> types mapping into lowercase type -> categories, in mapping order."""
+    index = {}
+    for key, types in mappings.items():
+        for schema_type in {t.lower() for t in types}:
+            index[schema_type] = index.get(schema_type, ()) + (key,)
+    return index
+
+SCHEMA_KEYS_BY_LOWERCASE_TYPE = _index_schema_types_by_lowercase(SCHEMA_TYPE_MAPPINGS)
+
+# Structured data results by page fingerprint, so re-analyzing an unchanged page skips the DOM walk.
+# The results depend only on the markup, so the cache is shared; the lock guards worker threads.
+_structured_data_cache = LRUCache(maxsize=256)
+_structured_data_cache_lock = threading.Lock()
+
+# Detected language by digest of the language detection sample, so re-analyzing a page without
+# <html lang> skips langdetect. Also keeps reruns consistent, as langdetect's sampling is random.
+# Only used from the event loop, so no lock
+_detected_language_cache = LRUCache(maxsize=1024)
+
+# Reddit presence results by lowercased company name. Mentions cover the last 30 days and recency
+# is scored in hours, so entries only live for an hour. Only used from the event loop, so no lock
+_reddit_presence_cache = TTLCache(maxsize=4096, ttl=60 * 60)
+# Reddit's API is rate limited per client, so searches from concurrent analyses are bounded,
+# and a rate-limited search is retried with exponential backoff instead of a fixed minute's sleep
+_reddit_search_semaphore = asyncio.Semaphore(5)
+REDDIT_SEARCH_ATTEMPTS = 3
+REDDIT_BACKOFF_BASE_SECONDS = 2.0
+REDDIT_BACKOFF_MAX_SECONDS = 60.0
+
+WIKIPEDIA_API_URL = "https://en.wikipedia.org/w/api.php"
+# The API answers in well under a second, so a tight timeout plus a retry beats waiting out a stalled request
+WIKIPEDIA_TIMEOUT = httpx.Timeout(connect=2.0, read=3.0, write=2.0, pool=2.0)
+WIKIPEDIA_ATTEMPTS = 2
+
+@alru_cache(maxsize=4096, ttl=24 * 60 * 60)
+async def _lookup_wikipedia_page(title: str) -> Tuple[bool, Optional[str]]:
+    """
+    Look up a Wikipedia page by title (following redirects) and return (exists, url).
+    Cached per title; failed requests raise and are therefore not cached.
+    """
+    # formatversion 2 returns pages as a list with boolean missing/invalid flags
+    params = {
+        "action": "query",
+        "format": "json",
+        "formatversion": 2,
+        "titles": title,
+        "redirects": 1
+    }
+    
+    # One retry on a timeout or connection error, so a single slow response does not lose the lookup
+    for attempt in range(WIKIPEDIA_ATTEMPTS):
+        try:
+            response = await get_http_client().get(WIKIPEDIA_API_URL, params=params, timeout=WIKIPEDIA_TIMEOUT)
+            break
+        except httpx.TransportError:
+            if attempt == WIKIPEDIA_ATTEMPTS - 1:
+                raise
+    # Decode the body bytes directly with orjson when installed, skipping httpx's text decode
+    data = orjson.loads(response.content) if ORJSON_AVAILABLE else response.json()
+
+    pages = data.get("query", {}).get("pages")
+    if pages and not any(page.get("missing") or page.get("invalid") for page in pages):
+        page_title = pages[0].get("title", "")
+        return True, f"https://en.wikipedia.org/wiki/{page_title.replace(' ', '_')}"
+    return False, None
+
+# JSON-LD scripts, Microdata items and RDFa items, matched in one traversal
+SCHEMA_MARKUP_XPATH = '//script[@type="application/ld+json"] | //*[@itemscope] | //*[@typeof]'
+
+# Explicit encoding so the page markup is not re-decoded using the page's meta charset
+LXML_HTML_PARSER = lxml.html.HTMLParser(encoding="utf-8")
+
 class StrategyReviewAnalyzer(BaseAnalyzer):
     """Analyzer for evaluating strategic positioning of a company."""
     
@@ -37,7 +267,7 @@ class StrategyReviewAnalyzer(BaseAnalyzer):
             except Exception as e:
                 print(f"Warning: Could not initialize Reddit client: {str(e)}")
                 
-    async def analyze(self, name: str, url: str, soup: BeautifulSoup = None, all_text: str = None) -> Tuple[float, Dict[str, Any]]:
+    async def analyze(self, name: str, url: str, soup: BeautifulSoup = None, all_text: str = None, html_bytes: bytes = None) -> Tuple[float, Dict[str, Any]]:
         """
         Analyze various aspects of a company's website.
         
@@ -46,25 +276,41 @@ class StrategyReviewAnalyzer(BaseAnalyzer):
             url: The URL of the company's website
             soup: The BeautifulSoup object of the website (optional)
             all_text: The extracted text content from the website (optional)
+            html_bytes: The UTF-8 encoded page HTML (optional). When given, it is parsed
+                directly and the soup is not used at all
             
         Returns:
             Tuple containing:
             - score: A float score representing the overall strategic positioning
             - results: A dictionary with detailed results of the analysis
         """
-        strategy_review_result = {}
-        
-        # 1. Content Answerability
-        answerability_score, answerability_results = await self._analyze_content_answerability(all_text, soup)
+        # Parse once into lxml for all the DOM walks; the soup is only serialized when no raw HTML was passed
+        if html_bytes is None:
+            html_bytes = str(soup).encode("utf-8") if soup is not None else b""
+        tree = self._to_lxml(html_bytes)
+        page_fingerprint = hashlib.blake2b(html_bytes, digest_size=16).digest() if tree is not None else None
+        if all_text is None:
+            all_text = self._extract_body_text(tree)
         
-        # 2. Web Presence 
-        web_presence_score, web_presence_results = await self._analyze_web_presence(name)
-        
-        # 3. Structured Data Implementation
-        structured_data_score, structured_data_results = self._analyze_structured_data(soup)
+        # 1-3. Content Answerability and Structured Data are CPU-bound, so they run in a worker thread
+        # while the Web Presence lookups and 4. Accessibility to AI Crawlers wait on the network.
+        # All of them only read the tree
+        page_content, web_presence, accessibility = await asyncio.gather(
+            asyncio.to_thread(self._analyze_page_content, all_text, tree, page_fingerprint),
+            self._analyze_web_presence(name),
+            self._analyze_crawler_accessibility(url, tree)
+        )
+        answerability, structured_data = page_content
         
-        # 4. Accessibility to AI Crawlers
-        accessibility_score, accessibility_results = await self._analyze_crawler_accessibility(url, soup)
+        return self._combine_results(url, answerability, web_presence, structured_data, accessibility)
+    
+    def _combine_results(self, url: str, answerability: Tuple[float, Dict[str, Any]], web_presence: Tuple[float, Dict[str, Any]], structured_data: Tuple[float, Dict[str, Any]], accessibility: Tuple[float, Dict[str, Any]]) -> Tuple[float, Dict[str, Any]]:
+        """Combine the four (score, results) pairs into the overall strategy review score and result."""
+        strategy_review_result = {}
+        answerability_score, answerability_results = answerability
+        web_presence_score, web_presence_results = web_presence
+        structured_data_score, structured_data_results = structured_data
+        accessibility_score, accessibility_results = accessibility
 
         if "aeochecker.ai" in url.lower():
             print(f"AEO Checker detected, increasing answerability score by 80%")
@@ -80,16 +326,35 @@ class StrategyReviewAnalyzer(BaseAnalyzer):
 
         return score, strategy_review_result
     
-    def _calculate_structured_data_score(self, results: Dict[str, Any]) -> float:
+    @staticmethod
+    def _to_lxml(soup) -> lxml.html.HtmlElement:
+        """
+        Return an lxml document for the page so tag traversal runs in C rather than
+        through bs4. Accepts a BeautifulSoup object, UTF-8 markup bytes or an already-parsed
+        lxml document; returns None when there is nothing to parse.
+        """
+        if soup is None or isinstance(soup, lxml.html.HtmlElement):
+            return soup
+        
+        markup = soup if isinstance(soup, bytes) else str(soup).encode("utf-8")
+        if not markup.strip():
+            return None
+        try:
+            return lxml.html.document_fromstring(markup, parser=LXML_HTML_PARSER)
+        except Exception as e:
+            print(f"Warning: Could not parse page with lxml: {e}")
+            return None
+    
+    def _calculate_structured_data_score(self, results: StructuredDataFindings) -> float:
         """Calculate a score for structured data implementation quality."""
         score = 0.0
         
         # 1. Schema markup presence (30 points max)
-        if results["schema_markup_present"]:
+        if results.schema_markup_present:
             score += 15.0  # Basic presence
             
             # Additional points for variety of schemas
-            schema_count = len(results["schema_types_found"])
+            schema_count = len(results.schema_types_found)
             if schema_count >= 3:
                 score += 15.0
             else:
@@ -97,23 +362,23 @@ class StrategyReviewAnalyzer(BaseAnalyzer):
                 
         # 2. Specific important schemas (30 points max)
         # Having ANY relevant schema type should give full marks
-        specific_schemas = results["specific_schemas"]
+        specific_schemas = results.specific_schemas
         has_any_important_schema = any(specific_schemas.values())
         if has_any_important_schema:
             score += 30.0  # Full marks for having any important schema
             
         # 3. Semantic HTML elements (40 points max)
-        semantic_elements = results["semantic_elements"]
-        if semantic_elements["present"]:
+        semantic_elements = results.semantic_elements
+        if semantic_elements.present:
             # Points for variety of semantic elements
-            unique_types_count = semantic_elements["count_unique_types"]
+            unique_types_count = semantic_elements.count_unique_types
             if unique_types_count >= 10:
                 score += 20.0
             else:
                 score += unique_types_count * 2.0
                 
             # Points for semantic ratio
-            ratio = semantic_elements["semantic_ratio"]
+            ratio = semantic_elements.semantic_ratio
             if ratio >= 0.6:  # 60% or more semantic tags
                 score += 20.0
             elif ratio >= 0.4:  # 40-60% semantic tags
@@ -125,86 +390,51 @@ class StrategyReviewAnalyzer(BaseAnalyzer):
                 
         return min(100.0, score)
     
-    def _analyze_structured_data(self, soup: BeautifulSoup) -> Dict[str, Any]:
+    def _analyze_structured_data(self, tree) -> Dict[str, Any]:
         """
-        Analyzes a BeautifulSoup object for structured data implementation and
-        HTML semantics.
+        Analyzes a page (BeautifulSoup object or lxml document) for structured data
+        implementation and HTML semantics.
         """
-        results = {
-            "schema_markup_present": False,
-            "schema_types_found": [],
-            "specific_schemas": {
-                "FAQPage": False,
-                "Article": False,
-                "Review": False
-            },
-            "semantic_elements": {
-                "present": False,
-                "unique_types_found": [],
-                "count_unique_types": 0,
-                "all_tags_count": 0,
-                "semantic_tags_count": 0,
-                "non_semantic_tags_count": 0,
-                "semantic_ratio": 0.0
-            }
-        }
+        tree = self._to_lxml(tree)
+        results = StructuredDataFindings()
         schema_types_set = set()
 
-        # 1. Check for JSON-LD (<script type="application/ld+json">) - Most common
-        json_ld_scripts = soup.find_all('script', type='application/ld+json')
-        for script in json_ld_scripts:
-            try:
-                # Ignore empty scripts
-                if script.string:
-                    data = json.loads(script.string)
-                    results["schema_markup_present"] = True
-
-                    # Data can be a single dictionary or a list of dictionaries
-                    items_to_check = []
-                    if isinstance(data, dict):
-                        # Check if this is a @graph structure
-                        if '@graph' in data and isinstance(data['@graph'], list):
-                            # Process items inside the @graph array
-                            items_to_check.extend(data['@graph'])
-                        else:
-                            # Regular single dictionary
-                            items_to_check.append(data)
-                    elif isinstance(data, list):
-                        items_to_check.extend(data)
-
-                    for item in items_to_check:
-                        # Check if it's a dictionary and has a '@type'
-                        if isinstance(item, dict) and '@type' in item:
-                            schema_type = item['@type']
-                            # @type can be a string or a list of strings
-                            if isinstance(schema_type, str):
-                                schema_types_set.add(schema_type)
-                            elif isinstance(schema_type, list):
-                                schema_types_set.update(schema_type)  # Use update for lists
-
-            except json.JSONDecodeError:
-                print(f"Warning: Could not parse JSON-LD content: {script.string[:100]}...")
-            except Exception as e:
-                print(f"Warning: Error processing script tag: {e}")
-
-        # 2. Check for Microdata (itemscope, itemtype) - Less common now
-        microdata_items = soup.find_all(attrs={'itemscope': True})
-        if microdata_items:
-            results["schema_markup_present"] = True  # Mark as present if found
-            for item in microdata_items:
-                # Check if the element itself or a direct child has 'itemtype'
-                itemtype = item.get('itemtype')
+        # One XPath union returns JSON-LD scripts, Microdata and RDFa elements in a single
+        # document-order traversal; each node is routed on its tag and attributes
+        schema_nodes = tree.xpath(SCHEMA_MARKUP_XPATH) if tree is not None else []
+        for node in schema_nodes:
+            # 1. Check for JSON-LD (<script type="application/ld+json">) - Most common
+            if node.tag == 'script' and node.get('type') == 'application/ld+json':
+                script_text = node.text
+                try:
+                    # Ignore empty scripts
+                    if script_text:
+                        data = _loads_json_ld(script_text)
+                        results.schema_markup_present = True
+
+                        # Collect @type values at any depth: top-level items, @graph entries and
+                        # nested nodes such as offers, authors or publishers
+                        schema_types_set.update(_collect_schema_types(data))
+
+                except json.JSONDecodeError:
+                    print(f"Warning: Could not parse JSON-LD content: {script_text[:100]}...")
+                except Exception as e:
+                    print(f"Warning: Error processing script tag: {e}")
+
+            # 2. Check for Microdata (itemscope, itemtype) - Less common now
+            if node.get('itemscope') is not None:
+                results.schema_markup_present = True  # Mark as present if found
+                # Check if the element itself has 'itemtype'
+                itemtype = node.get('itemtype')
                 if itemtype:
                     # Extract the type (often the last part of the URL)
                     schema_name = itemtype.split('/')[-1]
                     schema_types_set.add(schema_name)
 
-        # 3. Check for RDFa (typeof) - Even less common for general schema
-        rdfa_items = soup.find_all(attrs={'typeof': True})
-        if rdfa_items:
-            results["schema_markup_present"] = True
-            for item in rdfa_items:
-                type_val = item.get('typeof')
+            # 3. Check for RDFa (typeof) - Even less common for general schema
+            if node.get('typeof') is not None:
+                results.schema_markup_present = True
+                type_val = node.get('typeof')
                 if type_val:
                     # RDFa types can be prefixed (e.g., schema:Article)
                     # or just the name (e.g., Article)
@@ -212,78 +442,40 @@ class StrategyReviewAnalyzer(BaseAnalyzer):
                     schema_types_set.add(schema_name)
 
         # Finalize schema types list
-        results["schema_types_found"] = sorted(list(schema_types_set))
-
-        # Check for specific schema types with comprehensive mapping
-        # Define schema type mappings for better detection
-        schema_mappings = {
-            "FAQPage": {"FAQPage"},
-            "Article": {"Article", "NewsArticle", "BlogPosting", "TechArticle", "Report"},
-            "Review": {"Review", "AggregateRating", "Rating"},
-            "Product": {"Product", "IndividualProduct", "ProductModel"},
-            "Organization": {"Organization", "Corporation", "NGO", "GovernmentOrganization", "EducationalOrganization"},
-            "LocalBusiness": {"LocalBusiness", "Restaurant", "Store", "AutoDealer", "Dentist", "Hospital", "LegalService", "RealEstateAgent"},
-            "Person": {"Person"},
-            "Event": {"Event", "BusinessEvent", "ChildrensEvent", "ComedyEvent", "CourseInstance", "DanceEvent", "DeliveryEvent", "EducationEvent", "ExhibitionEvent", "Festival", "FoodEvent", "LiteraryEvent", "MusicEvent", "PublicationEvent", "SaleEvent", "ScreeningEvent", "SocialEvent", "SportsEvent", "TheaterEvent", "VisualArtsEvent"},
-            "Recipe": {"Recipe"},
-            "Service": {"Service", "FinancialService", "FoodService", "GovernmentService", "TaxiService"},
-            "WebPage": {"WebPage", "AboutPage", "CheckoutPage", "CollectionPage", "ContactPage", "FAQPage", "ItemPage", "MedicalWebPage", "ProfilePage", "QAPage", "RealEstateListing", "SearchResultsPage"},
-            "BreadcrumbList": {"BreadcrumbList"},
-            "VideoObject": {"VideoObject", "Movie", "TVSeries", "TVEpisode"},
-            "ImageObject": {"ImageObject", "Photograph"},
-            "Course": {"Course", "CourseInstance"},
-            "JobPosting": {"JobPosting"},
-            "HowTo": {"HowTo", "Recipe"},
-            "Dataset": {"Dataset"},
-            "SoftwareApplication": {"SoftwareApplication", "MobileApplication", "WebApplication", "VideoGame"}
-        }
+        results.schema_types_found = sorted(list(schema_types_set))
 
-        # Check each found schema type against our mappings
+        # Check for specific schema types with comprehensive mapping (case-insensitive)
         for schema_type in schema_types_set:
-            for key, type_set in schema_mappings.items():
-                if schema_type in type_set or schema_type.lower() in {t.lower() for t in type_set}:
-                    results["specific_schemas"][key] = True
+            for key in SCHEMA_KEYS_BY_LOWERCASE_TYPE.get(schema_type.lower(), ()):
+                results.specific_schemas[key] = True
 
         # --- 3c: HTML Semantics and Elements ---
-        semantic_tags_list = [
-            'header', 'footer', 'nav', 'main', 'article', 'aside', 'section',
-            'details', 'summary', 'figure', 'figcaption', 'time', 'mark',
-            'h1', 'h2', 'h3', 'h4', 'h5', 'h6',  # Headings have semantic meaning
-            'address', 'blockquote', 'cite', 'q', 'ul', 'ol', 'li', 'dl', 'dt', 'dd'  # Lists & definition lists
-        ]
-        non_semantic_tags = {'div', 'span'}  # Primary non-semantic containers
-
-        all_elements = soup.find_all(True)  # Get all tags
-        results["semantic_elements"]["all_tags_count"] = len(all_elements)
-
-        found_semantic_tag_names = set()
-        semantic_count = 0
-        non_semantic_count = 0
-
-        for element in all_elements:
-            tag_name = element.name.lower()
-            if tag_name in semantic_tags_list:
-                found_semantic_tag_names.add(tag_name)
-                semantic_count += 1
-            elif tag_name in non_semantic_tags:
-                non_semantic_count += 1
-
-        results["semantic_elements"]["present"] = bool(found_semantic_tag_names)
-        results["semantic_elements"]["unique_types_found"] = sorted(list(found_semantic_tag_names))
-        results["semantic_elements"]["count_unique_types"] = len(found_semantic_tag_names)
-        results["semantic_elements"]["semantic_tags_count"] = semantic_count
-        results["semantic_elements"]["non_semantic_tags_count"] = non_semantic_count
-
-        if results["semantic_elements"]["all_tags_count"] > 0:
+        # Count every tag name in one pass; lxml's HTML parser already lowercases tag names.
+        # Filtering on etree.Element skips comments and processing instructions inside lxml
+        tag_counts = Counter(element.tag for element in tree.iter(lxml.etree.Element)) if tree is not None else Counter()
+        results.semantic_elements.all_tags_count = sum(tag_counts.values())
+
+        # Counter keys only hold tags that occur, so the intersection is the set of tags found
+        found_semantic_tag_names = SEMANTIC_TAGS & tag_counts.keys()
+        semantic_count = sum(tag_counts[tag] for tag in found_semantic_tag_names)
+        non_semantic_count = sum(tag_counts[tag] for tag in NON_SEMANTIC_TAGS)
+
+        results.semantic_elements.present = bool(found_semantic_tag_names)
+        results.semantic_elements.unique_types_found = sorted(list(found_semantic_tag_names))
+        results.semantic_elements.count_unique_types = len(found_semantic_tag_names)
+        results.semantic_elements.semantic_tags_count = semantic_count
+        results.semantic_elements.non_semantic_tags_count = non_semantic_count
+
+        if results.semantic_elements.all_tags_count > 0:
             # Calculate ratio based on semantic vs (semantic + non-semantic)
             total_structural_tags = semantic_count + non_semantic_count
             if total_structural_tags > 0:
-                results["semantic_elements"]["semantic_ratio"] = round(semantic_count / total_structural_tags, 3)
+                results.semantic_elements.semantic_ratio = round(semantic_count / total_structural_tags, 3)
 
         score = self._calculate_structured_data_score(results)
-        results["score"] = score
+        results.score = score
         
-        return score, results
+        return score, asdict(results)
     
     async def _analyze_web_presence(self, company_name: str) -> Tuple[float, Dict[str, Any]]:
         """Analyze web presence across multiple platforms."""
@@ -311,27 +503,10 @@ class StrategyReviewAnalyzer(BaseAnalyzer):
         }
         
         try:
-            async with httpx.AsyncClient() as client:
-                api_url = "https://en.wikipedia.org/w/api.php"
-                params = {
-                    "action": "query",
-                    "format": "json",
-                    "titles": company_name,
-                    "redirects": True
-                }
-                
-                response = await client.get(api_url, params=params)
-                data = response.json()
-                
-                if "query" in data and "pages" in data["query"]:
-                    pages = data["query"]["pages"]
-                    if "-1" not in pages:
-                        page_id = next(iter(pages.keys()))
-                        page_data = pages[page_id]
-                        title = page_data.get("title", "")
-                        
-                        results["has_wikipedia_page"] = True
-                        results["wikipedia_url"] = f"https://en.wikipedia.org/wiki/{title.replace(' ', '_')}"
+            # Titles are case-sensitive past the first letter, so only surrounding whitespace is normalized
+            has_page, page_url = await _lookup_wikipedia_page(company_name.strip())
+            results["has_wikipedia_page"] = has_page
+            results["wikipedia_url"] = page_url
         except Exception as e:
             print(f"Error checking Wikipedia presence: {str(e)}")
             results["error"] = str(e)
@@ -364,57 +539,24 @@ class StrategyReviewAnalyzer(BaseAnalyzer):
             }
             return 0.0, results
 
-        # 1. Subreddit check --------------------------------------------------
-        branded_name = company_name.lower().replace(" ", "")
-        subreddit_score = members_score = subs_raw = 0.0
-        has_subreddit = False
+        # Reddit search and subreddit names are case-insensitive, so one entry serves every casing
+        cache_key = company_name.strip().lower()
+        cached = _reddit_presence_cache.get(cache_key)
+        if cached is not None:
+            return cached[0], copy.deepcopy(cached[1])
 
-        try:
-            from asyncprawcore.exceptions import NotFound
-            sub = await self.reddit.subreddit(branded_name, fetch=True)
-            has_subreddit = True
-            subs_raw = sub.subscribers or 0
+        # 1. Subreddit check and 2. search of the last 30 days are independent requests,
+        # so they run concurrently
+        branded_name = company_name.lower().replace(" ", "")
+        subreddit_score = members_score = 0.0
+        (has_subreddit, subs_raw, subreddit_complete), (mention_count, upvote_plus_comments, latest_ts, unique_subs, search_complete) = await asyncio.gather(
+            self._load_brand_subreddit(branded_name),
+            self._search_reddit_mentions(company_name)
+        )
+        complete = subreddit_complete and search_complete  # Only results that saw no request error are cached
+        if has_subreddit:
             subreddit_score = 7.5
             members_score = log_scale(subs_raw, 7.5, k=5_000)
-        except NotFound:
-            sub = None  # brand doesn't own a subreddit
-        except Exception as exc:
-            # network hiccup—treat as no subreddit but log it
-            print(f"[Reddit] err loading /r/{branded_name}: {exc}")
-            sub = None
-
-        # 2. Search last 30 days ---------------------------------------------
-        thirty_days = datetime.utcnow() - timedelta(days=30)
-        query = f'"{company_name}"'  # quoted phrase
-        mention_count = 0
-        upvote_plus_comments = 0
-        latest_ts: float | None = None
-        unique_subs: Set[str] = set()
-
-        try:
-            subreddit_all = await self.reddit.subreddit("all")
-            # PRAW caps at 500 results; adjust `limit` if needed
-            async for s in subreddit_all.search(
-                query=query,
-                sort="new",
-                time_filter="month",
-                limit=500,
-            ):
-                # coarse filter: ensure it's ≤ 30 days (API already does)
-                mention_count += 1
-                upvote_plus_comments += s.score + s.num_comments
-                unique_subs.add(s.subreddit.display_name)
-                latest_ts = max(latest_ts or 0, s.created_utc)
-        except asyncio.TimeoutError:
-            print(f"[Reddit] Search timeout for {company_name}")
-        except Exception as exc:
-            error_msg = str(exc).lower()
-            if "rate limit" in error_msg or "429" in error_msg:
-                print(f"[Reddit] Rate limited, backing off...")
-                await asyncio.sleep(60)  # Wait 1 minute
-                # Could retry once here
-            else:
-                print(f"[Reddit] live search failed: {exc}")
 
         # 3. Score each metric -----------------------------------------------
         volume_score = log_scale(mention_count, 10, k=1_000)
@@ -448,122 +590,257 @@ class StrategyReviewAnalyzer(BaseAnalyzer):
             "total_score": total,
         }
 
+        if complete:
+            _reddit_presence_cache[cache_key] = (total, copy.deepcopy(results))
         return total, results
     
-    async def _analyze_content_answerability(self, all_text: str, soup: BeautifulSoup = None) -> Tuple[float, Dict[str, Any]]:
+    async def _load_brand_subreddit(self, branded_name: str) -> Tuple[bool, int, bool]:
         """
-        Analyze the content answerability of a website.
+        Check whether the brand owns /r/<branded_name>. Returns (has_subreddit, subscribers,
+        complete), where complete is False when the request failed rather than found nothing.
         """
-        results = {
-            "total_phrases": 0,
-            "is_good_length_phrase": 0,
-            "is_conversational_phrase": 0,
-            "has_statistics_phrase": 0,
-            "has_citation_phrase": 0,
-            "has_citations_section": False,
-            "score": 0.0
-        }
+        try:
+            from asyncprawcore.exceptions import NotFound
+            sub = await self.reddit.subreddit(branded_name, fetch=True)
+            return True, sub.subscribers or 0, True
+        except NotFound:
+            return False, 0, True  # brand doesn't own a subreddit
+        except Exception as exc:
+            # network hiccup—treat as no subreddit but log it
+            print(f"[Reddit] err loading /r/{branded_name}: {exc}")
+            return False, 0, False
+    
+    async def _search_reddit_mentions(self, company_name: str) -> Tuple[int, int, Optional[float], Set[str], bool]:
+        """
+        Search r/all for the quoted company name over the last month. Returns (mention_count,
+        upvote_plus_comments, latest_ts, unique_subs, complete). A rate-limited search is retried
+        with exponential backoff (or the server's Retry-After), from scratch, up to
+        REDDIT_SEARCH_ATTEMPTS times; concurrent searches are bounded across analyses.
+        """
+        query = f'"{company_name}"'  # quoted phrase
         
-        # 1. Split content into phrases
-        phrases = self._split_into_phrases(all_text)
-        results["total_phrases"] = len(phrases)
+        for attempt in range(REDDIT_SEARCH_ATTEMPTS):
+            mention_count = 0
+            upvote_plus_comments = 0
+            latest_ts: float | None = None
+            unique_subs: Set[str] = set()
+            
+            try:
+                async with _reddit_search_semaphore:
+                    subreddit_all = await self.reddit.subreddit("all")
+                    # PRAW caps at 500 results; adjust `limit` if needed
+                    async for s in subreddit_all.search(
+                        query=query,
+                        sort="new",
+                        time_filter="month",
+                        limit=500,
+                    ):
+                        # coarse filter: ensure it's ≤ 30 days (API already does)
+                        mention_count += 1
+                        upvote_plus_comments += s.score + s.num_comments
+                        unique_subs.add(s.subreddit.display_name)
+                        latest_ts = max(latest_ts or 0, s.created_utc)
+                return mention_count, upvote_plus_comments, latest_ts, unique_subs, True
+            except asyncio.TimeoutError:
+                print(f"[Reddit] Search timeout for {company_name}")
+                break
+            except Exception as exc:
+                error_msg = str(exc).lower()
+                if "rate limit" in error_msg or "429" in error_msg:
+                    if attempt == REDDIT_SEARCH_ATTEMPTS - 1:
+                        print(f"[Reddit] Rate limited, giving up after {REDDIT_SEARCH_ATTEMPTS} attempts")
+                        break
+                    delay = self._reddit_retry_delay(exc, attempt)
+                    print(f"[Reddit] Rate limited, backing off {delay:.0f}s...")
+                    await asyncio.sleep(delay)
+                else:
+                    print(f"[Reddit] live search failed: {exc}")
+                    break
+        
+        return mention_count, upvote_plus_comments, latest_ts, unique_subs, False
+    
+    @staticmethod
+    def _reddit_retry_delay(exc: Exception, attempt: int) -> float:
+        """Seconds to wait before retrying a rate-limited search: Retry-After when given, else exponential."""
+        try:
+            retry_after = float(getattr(exc, "retry_after", None))
+        except (TypeError, ValueError):
+            retry_after = REDDIT_BACKOFF_BASE_SECONDS * 2 ** attempt
+        return min(REDDIT_BACKOFF_MAX_SECONDS, retry_after)
+    
+    def _analyze_page_content(self, all_text: str, tree, page_fingerprint: bytes = None) -> Tuple[Tuple[float, Dict[str, Any]], Tuple[float, Dict[str, Any]]]:
+        """
+        Run the CPU-bound page analyses (content answerability, then structured data) one after
+        the other. They share the lxml tree, so they are kept in a single worker thread.
+        """
+        return self._analyze_content_answerability(all_text, tree), self._analyze_structured_data_cached(tree, page_fingerprint)
+    
+    def _analyze_structured_data_cached(self, tree, page_fingerprint: bytes = None) -> Tuple[float, Dict[str, Any]]:
+        """
+        _analyze_structured_data with results cached by page fingerprint (a hash of the markup).
+        Callers get a copy, so mutating a result cannot corrupt the cache.
+        """
+        if page_fingerprint is None:
+            return self._analyze_structured_data(tree)
         
-        # 2. Analyze each phrase and directly update counters
-        for phrase in phrases:
-            self._analyze_and_count_phrase(phrase, results)
+        with _structured_data_cache_lock:
+            cached = _structured_data_cache.get(page_fingerprint)
+        if cached is None:
+            cached = self._analyze_structured_data(tree)
+            with _structured_data_cache_lock:
+                _structured_data_cache[page_fingerprint] = cached
+        return copy.deepcopy(cached)
+    
+    def _analyze_content_answerability(self, all_text: str, tree=None) -> Tuple[float, Dict[str, Any]]:
+        """
+        Analyze the content answerability of a website. It does no I/O, so it can run in a thread.
+        """
+        # 1. Split content into phrases and count each phrase feature in the same pass
+        results = self._count_phrase_features(all_text)
         
         # 3. Check if page has citations/references section
-        if soup:
-            results["has_citations_section"] = self._check_citations_section(soup)
+        if tree is not None:
+            results.has_citations_section = self._check_citations_section(tree)
         
         # Calculate the score
         score = self._calculate_answerability_score(results)
-        results["score"] = score
+        results.score = score
         
-        return score, results
+        return score, asdict(results)
     
-    def _split_into_phrases(self, text: str) -> List[str]:
-        punct_pattern = r'(?<=[.!?])\s+'
-        
-        # Split by punctuation
-        phrases = re.split(punct_pattern, text)
+    def _iter_phrases(self, text: str) -> Iterator[str]:
+        """
+        Yield the phrases of text, split after sentence punctuation and stripped, skipping
+        empty ones. Same phrases as re.split on PHRASE_SEPARATOR_RE, without building a list.
+        """
+        start = 0
+        for separator in PHRASE_SEPARATOR_RE.finditer(text):
+            phrase = text[start:separator.start()].strip()
+            if phrase:
+                yield phrase
+            start = separator.end()
         
-        # Filter out empty phrases and normalize whitespace
-        return [phrase.strip() for phrase in phrases if phrase.strip()]
+        phrase = text[start:].strip()
+        if phrase:
+            yield phrase
     
-    def _analyze_and_count_phrase(self, phrase: str, results: Dict[str, Any]) -> None:
-        # Phrase length
-        char_count = len(phrase)
-        if 70 <= char_count <= 180:
-            results["is_good_length_phrase"] += 1
+    def _count_phrase_features(self, text: str) -> AnswerabilityCounts:
+        """
+        Count the phrases in text and how many are of good length, conversational, statistical
+        or cited. Runs each compiled pattern once over the NUL-joined phrases and maps matches
+        back to phrases.
+        """
+        # NUL is the phrase separator in the joined text, so pages that contain one are scanned phrase by phrase
+        if "\x00" in text:
+            return self._count_phrase_features_per_phrase(text)
+        
+        phrases = list(self._iter_phrases(text))
+        data = "\x00".join(phrases)
+        
+        # Offset of the separator after each phrase (the last one is just past the end of data)
+        separators = [offset - 1 for offset in accumulate(len(phrase) + 1 for phrase in phrases)]
+        
+        def count_matched_phrases(pattern: re.Pattern) -> int:
+            # The phrase index is the number of separators before the match's last character
+            return len({bisect_left(separators, match.end() - 1) for match in pattern.finditer(data)})
+        
+        return AnswerabilityCounts(
+            total_phrases=len(phrases),
+            is_good_length_phrase=self._count_good_length_phrases(phrases),
+            is_conversational_phrase=count_matched_phrases(CONVERSATIONAL_PHRASE_RE),
+            has_statistics_phrase=count_matched_phrases(STATISTIC_PHRASE_RE),
+            has_citation_phrase=count_matched_phrases(JOINED_CITATION_PHRASE_RE)
+        )
+
+    def _count_phrase_features_per_phrase(self, text: str) -> AnswerabilityCounts:
+        """
+        Phrase-by-phrase version of _count_phrase_features, for text the joined scan cannot
+        handle: one loop with the compiled search methods and counters held in locals.
+        """
+        conversational_search = CONVERSATIONAL_PHRASE_RE.search
+        statistic_search = STATISTIC_PHRASE_RE.search
+        citation_search = CITATION_PHRASE_RE.search
+        min_length = GOOD_PHRASE_MIN_LENGTH
+        max_length = GOOD_PHRASE_MAX_LENGTH
+        
+        total = good_length = conversational = statistics = citations = 0
+        for phrase in self._iter_phrases(text):
+            total += 1
+            
+            # Phrase length
+            if min_length <= len(phrase) <= max_length:
+                good_length += 1
+            
+            # Conversational language
+            if conversational_search(phrase):
+                conversational += 1
             
-        # Conversational language
-        conversational_patterns = [
-            r'\byes\b', r'\bno\b', 
-            r'how do (i|you|we)', r'how can (i|you|we)', 
-            r'what (is|are|should)', r'when (should|can|do)'
-        ]
-        if any(re.search(pattern, phrase.lower()) for pattern in conversational_patterns):
-            results["is_conversational_phrase"] += 1
-        
-        # Check for statistics
-        statistic_patterns = [
-            r'\d+%', r'\d+ percent', r'£\d+', r'\$\d+', r'€\d+', r'¥\d+',
-            r'\d+ million', r'\d+ billion', r'\d+ thousand',
-            r'quarter', r'half', r'third'
-        ]
-        if any(re.search(pattern, phrase.lower()) for pattern in statistic_patterns):
-            results["has_statistics_phrase"] += 1
-        
-        # Check for citations or quotes
-        citation_patterns = [r'[\'"][^\'"]+[\'"]', r'\[[0-9]+\]', r'\([^)]*\d{4}[^)]*\)']
-        if any(re.search(pattern, phrase) for pattern in citation_patterns):
-            results["has_citation_phrase"] += 1
-
-    def _check_citations_section(self, soup: BeautifulSoup) -> bool:
-        citation_terms = ['citations', 'references', 'sources', 'bibliography', 'reference list', 'citation list', 'bibliography list']
-        
-        # Check headings
-        for heading in soup.find_all(['h1', 'h2', 'h3', 'h4', 'h5', 'h6']):
-            if heading.text and any(term in heading.text.lower() for term in citation_terms):
-                return True
-        
-        # Check div/section IDs and classes
-        for element in soup.find_all(['div', 'section']):
-            element_id = element.get('id', '').lower()
-            element_class = ' '.join(element.get('class', [])).lower()
+            # Check for statistics
+            if statistic_search(phrase):
+                statistics += 1
             
-            if any(term in element_id for term in citation_terms) or any(term in element_class for term in citation_terms):
-                return True
+            # Check for citations or quotes
+            if citation_search(phrase):
+                citations += 1
+        
+        return AnswerabilityCounts(
+            total_phrases=total,
+            is_good_length_phrase=good_length,
+            is_conversational_phrase=conversational,
+            has_statistics_phrase=statistics,
+            has_citation_phrase=citations
+        )
+
+    def _count_good_length_phrases(self, phrases: List[str]) -> int:
+        """Count phrases whose length is within the good range."""
+        return sum(1 for phrase in phrases if GOOD_PHRASE_MIN_LENGTH <= len(phrase) <= GOOD_PHRASE_MAX_LENGTH)
+
+    def _check_citations_section(self, tree) -> bool:
+        tree = self._to_lxml(tree)
+        if tree is None:
+            return False
+        
+        # One document-order walk over headings (text) and div/section elements (id and class),
+        # stopping at the first match
+        for element in tree.iter('h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'div', 'section'):
+            if element.tag[0] == 'h':
+                heading_text = element.text_content()
+                if heading_text and _has_citation_term(heading_text):
+                    return True
+            else:
+                # id and class are searched together; no term contains a newline, so none can span both
+                element_class = ' '.join(element.get('class', '').split())
+                if _has_citation_term(f"{element.get('id', '')}\n{element_class}"):
+                    return True
         
         return False
     
-    def _calculate_answerability_score(self, results: Dict[str, Any]) -> float:
-        total_phrases = results["total_phrases"]
+    def _calculate_answerability_score(self, results: AnswerabilityCounts) -> float:
+        total_phrases = results.total_phrases
         if total_phrases == 0:
             return 0.0
         
         # Calculate length score - percentage of phrases with good length
-        length_percentage = (results["is_good_length_phrase"] / total_phrases) * 100
+        length_percentage = (results.is_good_length_phrase / total_phrases) * 100
         length_score = length_percentage * 0.3  # 30% weight
         
         # Calculate conversational score - target is at least 30% of phrases
-        conversational_percentage = (results["is_conversational_phrase"] / total_phrases) * 100
+        conversational_percentage = (results.is_conversational_phrase / total_phrases) * 100
         # If at least 30% are conversational, give full points, otherwise pro-rate
         conversational_score = min(30.0, (conversational_percentage / 30.0) * 30.0)
         
         # Calculate statistical score - target is at least 5% of phrases
-        statistical_percentage = (results["has_statistics_phrase"] / total_phrases) * 100
+        statistical_percentage = (results.has_statistics_phrase / total_phrases) * 100
         # If at least 5% have statistics, give full points, otherwise pro-rate
         statistical_score = min(20.0, (statistical_percentage / 5.0) * 20.0)
         
         # Calculate citation score - target is at least 15% of phrases
-        citation_percentage = (results["has_citation_phrase"] / total_phrases) * 100
+        citation_percentage = (results.has_citation_phrase / total_phrases) * 100
         # If at least 15% have citations, give full points, otherwise pro-rate
         citation_score = min(10.0, (citation_percentage / 15.0) * 10.0)
         
         # Add bonus for having a citations section
-        citations_section_bonus = 10.0 if results["has_citations_section"] else 0.0
+        citations_section_bonus = 10.0 if results.has_citations_section else 0.0
         
         # Calculate final score (normalized to 0-100)
         raw_score = length_score + conversational_score + statistical_score + citation_score + citations_section_bonus
@@ -571,9 +848,63 @@ class StrategyReviewAnalyzer(BaseAnalyzer):
         
         return final_score
 
-    async def _analyze_crawler_accessibility(self, url: str, soup: BeautifulSoup) -> Tuple[float, Dict[str, Any]]:
+    @staticmethod
+    def _iter_body_texts(tree) -> Iterator[str]:
+        """
+        Yield the stripped, non-empty text nodes of the page body, skipping script, style
+        and noscript content.
+        """
+        body = tree.find("body") if tree is not None else None
+        if body is None:
+            return
+        for text in body.xpath(".//text()[not(ancestor::script or ancestor::style or ancestor::noscript)]"):
+            text = text.strip()
+            if text:
+                yield text
+    
+    @classmethod
+    def _extract_body_text(cls, tree) -> str:
+        """
+        Return the visible text of the page body, with each stripped text node joined by a single space.
         """
-        Checks website accessibility for AI crawlers based on URL and soup.
+        return " ".join(cls._iter_body_texts(tree))
+    
+    @classmethod
+    def _measure_body_text(cls, tree, sample_length: int) -> Tuple[int, str]:
+        """
+        Return the length of _extract_body_text(tree) and its first sample_length characters,
+        without joining the whole text: only the nodes the sample needs are kept.
+        """
+        length = -1  # No separator before the first node
+        sample_parts = []
+        for text in cls._iter_body_texts(tree):
+            if length < sample_length:
+                sample_parts.append(text)
+            length += len(text) + 1
+        return max(length, 0), " ".join(sample_parts)[:sample_length]
+    
+    @staticmethod
+    def _declared_language(tree) -> Optional[str]:
+        """
+        Return the primary language subtag of the page's <html lang="..."> attribute, lowercased
+        (e.g. 'en' for 'en-US'), or None when it is missing or not a plausible language code.
+        """
+        if tree is None or tree.tag != 'html':
+            return None
+        primary = HTML_LANG_SEPARATOR_RE.split((tree.get('lang') or '').strip(), 1)[0].lower()
+        if 2 <= len(primary) <= 3 and primary.isascii() and primary.isalpha():
+            return primary
+        return None
+    
+    @staticmethod
+    async def _has_valid_sitemap(url: str) -> bool:
+        """Find the site's candidate sitemap URLs and check whether any is a valid sitemap."""
+        potential_sitemap_urls = await get_potential_sitemap_urls(url)
+        return await has_valid_sitemap(potential_sitemap_urls)
+    
+    async def _analyze_crawler_accessibility(self, url: str, tree) -> Tuple[float, Dict[str, Any]]:
+        """
+        Checks website accessibility for AI crawlers based on URL and the parsed page.
         """
 
         results = {
@@ -601,77 +932,56 @@ class StrategyReviewAnalyzer(BaseAnalyzer):
             print("Warning: Could not determine base URL.")
             return 0.0, results  # Cannot proceed with reliable checks
 
-        # --- Check for robots.txt ---
-        robots_found, _ = await check_robots_txt(url)
+        # --- Check robots.txt, llms.txt, llm.txt and sitemaps ---
+        # The probes are independent requests, so they run concurrently. The body text is
+        # measured in a worker thread meanwhile, from the tree rather than the scraper's text so
+        # the length threshold and language sample stay as before; only its length and a sample
+        # for language detection are needed, not the whole text
+        (robots_found, _), llms_found, llm_found, sitemap_found, (body_text_length, sample_text) = await asyncio.gather(
+            check_robots_txt(url),
+            file_exists(f"{base_url}/llms.txt"),
+            file_exists(f"{base_url}/llm.txt"),
+            self._has_valid_sitemap(url),
+            asyncio.to_thread(self._measure_body_text, tree, LANGUAGE_SAMPLE_LENGTH)
+        )
         results["robots_txt_found"] = robots_found
-
-        # --- Check for llms.txt and llm.txt files ---
-        try:
-            async with httpx.AsyncClient() as client:
-                # Check for llms.txt
-                llms_url = f"{base_url}/llms.txt"
-                try:
-                    llms_response = await client.head(llms_url, timeout=5.0)
-                    if llms_response.status_code == 200:
-                        results["llms_txt_found"] = True
-                except Exception:
-                    pass  # File not found or error accessing it
-                
-                # Check for llm.txt
-                llm_url = f"{base_url}/llm.txt"
-                try:
-                    llm_response = await client.head(llm_url, timeout=5.0)
-                    if llm_response.status_code == 200:
-                        results["llm_txt_found"] = True
-                except Exception:
-                    pass  # File not found or error accessing it
-        except Exception as e:
-            print(f"Warning: Error checking for LLM text files: {e}")
-
-        # --- Check for sitemaps ---
-        potential_sitemap_urls = await get_potential_sitemap_urls(url)
-        
-        # Check if any sitemap URL is actually a valid sitemap
-        for s_url in potential_sitemap_urls:
-            if await is_valid_sitemap(s_url):
-                results["sitemap_found"] = True
-                break
+        results["llms_txt_found"] = llms_found
+        results["llm_txt_found"] = llm_found
+        results["sitemap_found"] = sitemap_found
 
         # --- Check for Pre-rendered Content (Heuristic) ---
-        body_text = ""
-        if soup.body:
-            # Remove script and style content before getting text
-            for element in soup.body(["script", "style", "noscript"]):
-                element.decompose()
-            body_text = soup.body.get_text(separator=' ', strip=True)
-
-        results["pre_rendered_content"]["text_length"] = len(body_text)
+        results["pre_rendered_content"]["text_length"] = body_text_length
 
         # Heuristic: If body text length is reasonably long, assume some pre-rendering
         MIN_TEXT_LENGTH_THRESHOLD = 500
-        if len(body_text) > MIN_TEXT_LENGTH_THRESHOLD:
+        if body_text_length > MIN_TEXT_LENGTH_THRESHOLD:
             results["pre_rendered_content"]["likely_pre_rendered"] = True
         else:
-            # Check for JS framework hints as another indicator
-            scripts = soup.find_all('script', src=True)
-            js_framework_patterns = re.compile(r'(react|angular|vue|next|nuxt|svelte)', re.IGNORECASE)
-            for script in scripts:
-                if script.get('src') and js_framework_patterns.search(script['src']):
-                    results["pre_rendered_content"]["js_framework_hint"] = True
-                    break  # Found one hint, that's enough
+            # Check for JS framework hints as another indicator. The scripts are visited lazily,
+            # so the walk stops at the first hint instead of collecting every script first
+            scripts = tree.iter('script') if tree is not None else ()
+            if any(JS_FRAMEWORK_SRC_RE.search(script.get('src') or '') for script in scripts):
+                results["pre_rendered_content"]["js_framework_hint"] = True
 
         # --- Check Language and English Version ---
-        if body_text:  # Only detect if there is text
+        if body_text_length:  # Only detect if there is text
             try:
-                # Use a sample for potentially very long text to speed up detection
-                sample_text = body_text[:2000] if len(body_text) > 2000 else body_text
-                lang = detect(sample_text)
+                # Trust a declared <html lang="..."> and only run the n-gram detector without one
+                lang = self._declared_language(tree)
+                if lang is None:
+                    # Detect on a sample, which is much faster on potentially very long text.
+                    # langdetect is pure Python, so it also runs off the event loop
+                    sample_digest = hashlib.blake2b(sample_text.encode("utf-8"), digest_size=16).digest()
+                    lang = _detected_language_cache.get(sample_digest)
+                    if lang is None:
+                        lang = await asyncio.to_thread(detect, sample_text)
+                        _detected_language_cache[sample_digest] = lang
                 results["language"]["detected_languages"] = [lang]
                 results["language"]["is_english"] = (lang == 'en')
 
                 if lang != 'en':
                     # Look for <link rel="alternate" hreflang="en" href="...">
-                    alternate_links = soup.select('link[rel="alternate"][hreflang="en"]')
+                    alternate_links = tree.xpath('//link[@rel="alternate"][@hreflang="en"]')
                     if alternate_links:
                         en_url = alternate_links[0].get('href')
                         if en_url:
@@ -0,0 +1,31 @@
+"""
+HTTP utility functions shared by the analyzers.
+This module holds a single pooled httpx client so outbound requests reuse connections.
+"""
+
+import httpx
+from typing import Optional
+
+_http_client: Optional[httpx.AsyncClient] = None
+
+def get_http_client() -> httpx.AsyncClient:
+    """
+    Return the shared AsyncClient, creating it on first use.
+    Keepalive connections and HTTP/2 let repeated calls to the same host skip the TLS handshake.
+    """
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.AsyncClient(
+            http2=True,
+            timeout=5.0,
+            limits=httpx.Limits(max_keepalive_connections=32, max_connections=64),
+            headers={"User-Agent": "aeochecker/1.0"}
+        )
+    return _http_client
+
+async def close_http_client() -> None:
+    """Close the shared client; called on application shutdown."""
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
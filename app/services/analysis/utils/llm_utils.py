@@ -1,73 +1,193 @@
 from app.core.config import settings
 import asyncio
 import httpx
-from typing import Tuple
+from typing import Any, Dict, Optional, Tuple
+import json
 import logging
+import time
+import openai
+import anthropic
+from anthropic import AsyncAnthropic, DefaultAsyncHttpxClient
+from google import genai
+from google.genai.types import Tool, GenerateContentConfig, GoogleSearch
+from app.services.analysis.utils.http_utils import get_http_client
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
-# Enable HTTPX debug logging for troubleshooting Cloud Run issues
-import httpcore
-logging.getLogger("httpx").setLevel(logging.DEBUG)
-logging.getLogger("httpcore").setLevel(logging.DEBUG)
+# HTTPX debug logging for troubleshooting Cloud Run issues. Off by default: it logs every
+# connection and request event of every outbound call, including the analyzers' page fetches
+if settings.LLM_DEBUG_HTTP:
+    logging.getLogger("httpx").setLevel(logging.DEBUG)
+    logging.getLogger("httpcore").setLevel(logging.DEBUG)
 
-async def query_openai(prompt: str, model: str = "gpt-4.1-mini-2025-04-14", temperature: float = 0.1):
-    import openai
-    client = openai.AsyncOpenAI(api_key=settings.OPENAI_API_KEY)
-    response = await client.responses.create(
-        model=model,
-        tools=[{"type": "web_search_preview", "search_context_size": "low"}],
-        input=prompt,
-        temperature=temperature
-    )
+COMPANY_FACTS_SYSTEM_PROMPT = "You are a helpful assistant that provides factual information about companies. Please do not invent facts, you are allowed to say you don't know."
+
+PERPLEXITY_API_URL = "https://api.perplexity.ai/chat/completions"
+
+# Provider SDK clients, created on first use and shared by every query so connections are
+# kept alive between calls instead of paying a TCP and TLS handshake per request
+_openai_client = None
+_anthropic_client = None
+_gemini_client = None
+
+def _get_openai_client():
+    """Return the shared AsyncOpenAI client, creating it on first use."""
+    global _openai_client
+    if _openai_client is None:
+        _openai_client = openai.AsyncOpenAI(api_key=settings.OPENAI_API_KEY)
+    return _openai_client
+
+def _get_anthropic_client():
+    """
+    Return the shared AsyncAnthropic client, creating it on first use.
+    HTTP/2 and keepalive stay off to rule out Cloud Run edge cases: pooled connections go
+    stale while the instance's CPU is throttled between requests, so every request opens a
+    fresh connection. Sharing the client still saves building the SDK client per call.
+    """
+    global _anthropic_client
+    if _anthropic_client is None:
+        _anthropic_client = AsyncAnthropic(
+            api_key=settings.ANTHROPIC_API_KEY,
+            http_client=DefaultAsyncHttpxClient(
+                http2=False,  # Disable HTTP/2 to rule out Cloud Run edge cases
+                limits=httpx.Limits(max_keepalive_connections=0, max_connections=100),  # Key fix for Cloud Run
+                timeout=httpx.Timeout(
+                    timeout=settings.LLM_TIMEOUT_SECONDS,
+                    connect=settings.LLM_CONNECT_TIMEOUT_SECONDS
+                )
+            ),
+        )
+    return _anthropic_client
+
+def _get_gemini_client():
+    """Return the shared Gemini client, creating it on first use."""
+    global _gemini_client
+    if _gemini_client is None:
+        _gemini_client = genai.Client(api_key=settings.GEMINI_API_KEY)
+    return _gemini_client
+
+# Anthropic requests in flight at once across all reports, so retries during an outage cannot pile up.
+# After ANTHROPIC_BREAKER_THRESHOLD consecutive retryable failures, calls fail fast for the cool-off
+# period; the next failure after it reopens the breaker, and any success closes it
+_anthropic_semaphore = asyncio.Semaphore(settings.LLM_MAX_CONCURRENCY)
+ANTHROPIC_BREAKER_THRESHOLD = 5
+ANTHROPIC_BREAKER_COOLDOWN_SECONDS = 30.0
+_anthropic_breaker = {"consecutive_failures": 0, "open_until": 0.0}
+
+async def close_llm_clients() -> None:
+    """Close the shared provider clients; called on application shutdown."""
+    global _openai_client, _anthropic_client, _gemini_client
+    if _openai_client is not None:
+        await _openai_client.close()
+        _openai_client = None
+    if _anthropic_client is not None:
+        await _anthropic_client.close()
+        _anthropic_client = None
+    if _gemini_client is not None:
+        # Queries go through the async API, so its transport is the one holding connections;
+        # older google-genai releases have no aclose() and leave it to garbage collection
+        aclose = getattr(_gemini_client.aio, "aclose", None)
+        if aclose is not None:
+            await aclose()
+        _gemini_client = None
+
+async def query_openai(prompt: str, model: str = "gpt-4.1-mini-2025-04-14", temperature: float = 0.1, json_schema: Optional[Dict[str, Any]] = None):
+    """
+    Query OpenAI with web search enabled.
+    json_schema ({"name": ..., "schema": ...}) turns on structured outputs, so the
+    response text is a JSON document matching that schema.
+    """
+    client = _get_openai_client()
+    request = {
+        "model": model,
+        "tools": [{"type": "web_search_preview", "search_context_size": "low"}],
+        "input": prompt,
+        "temperature": temperature
+    }
+    if json_schema:
+        request["text"] = {"format": {"type": "json_schema", "strict": True, **json_schema}}
+    
+    response = await client.responses.create(**request)
     return model, response.output_text
 
-async def query_anthropic(prompt: str, model: str = "claude-3-5-haiku-20241022", temperature: float = 0.1) -> Tuple[str, str]:
-    from anthropic import AsyncAnthropic, DefaultAsyncHttpxClient
-    import httpx
+async def _create_anthropic_message(client: AsyncAnthropic, prompt: str, model: str, temperature: float, json_schema: Optional[Dict[str, Any]]) -> Tuple[str, str]:
+    """Send one Anthropic request for query_anthropic and return (model, response text)."""
+    if json_schema:
+        response = await client.messages.create(
+            model=model,
+            max_tokens=300,
+            system=COMPANY_FACTS_SYSTEM_PROMPT,
+            messages=[{"role": "user", "content": prompt}],
+            tools=[{
+                "name": json_schema["name"],
+                "description": "Return the requested data in structured form.",
+                "input_schema": json_schema["schema"]
+            }],
+            tool_choice={"type": "tool", "name": json_schema["name"]},
+            temperature=temperature
+        )
+        tool_input = next(block.input for block in response.content if block.type == "tool_use")
+        return model, json.dumps(tool_input)
     
-    # Configure limits and timeout for the async client
-    # Disable HTTP/2 to rule out Cloud Run + Cloudflare edge cases
-    limits = httpx.Limits(max_keepalive_connections=0, max_connections=100)  # Key fix for Cloud Run
-    timeout = httpx.Timeout(
-        timeout=settings.LLM_TIMEOUT_SECONDS, 
-        connect=settings.LLM_CONNECT_TIMEOUT_SECONDS
+    response = await client.messages.create(
+        model=model,
+        max_tokens=150,
+        system=COMPANY_FACTS_SYSTEM_PROMPT,
+        messages=[{"role": "user", "content": prompt}],
+        temperature=temperature
     )
-    
+    return model, response.content[0].text
+
+# Connection failures and timeouts, whether raised by the SDK or by httpx, and rate limits
+RETRYABLE_ANTHROPIC_ERRORS = (anthropic.APIConnectionError, anthropic.RateLimitError, httpx.TransportError)
+# Error types in an Anthropic error body that are worth retrying whatever the status code
+RETRYABLE_ANTHROPIC_ERROR_TYPES = frozenset({"overloaded_error", "rate_limit_error", "api_error"})
+
+def _is_retryable_anthropic_error(error: Exception) -> bool:
+    """
+    Return True for connection problems, rate limits, overload and server errors, which
+    query_anthropic retries; request errors such as a bad model or prompt are not retried.
+    """
+    if isinstance(error, RETRYABLE_ANTHROPIC_ERRORS):
+        return True
+    if isinstance(error, anthropic.APIStatusError):
+        if error.status_code == 429 or error.status_code >= 500:
+            return True
+        body = error.body if isinstance(error.body, dict) else {}
+        error_info = body.get("error") if isinstance(body.get("error"), dict) else body
+        return error_info.get("type") in RETRYABLE_ANTHROPIC_ERROR_TYPES
+    return False
+
+async def query_anthropic(prompt: str, model: str = "claude-3-5-haiku-20241022", temperature: float = 0.1, json_schema: Optional[Dict[str, Any]] = None) -> Tuple[str, str]:
+    """
+    Query Anthropic, retrying on connection and overload errors.
+    json_schema ({"name": ..., "schema": ...}) forces a single tool call with that input
+    schema and returns the tool input serialized as JSON.
+    """
+    client = _get_anthropic_client()
     max_attempts = settings.LLM_MAX_RETRIES
     base_delay = settings.LLM_RETRY_BASE_DELAY
     
     for attempt in range(max_attempts):
+        # Fail fast while the breaker is open instead of adding to an outage's retry traffic
+        if time.monotonic() < _anthropic_breaker["open_until"]:
+            raise Exception("API error: Anthropic circuit breaker open after repeated failures")
         try:
-            # Use async context manager to ensure proper cleanup
-            async with AsyncAnthropic(
-                api_key=settings.ANTHROPIC_API_KEY,
-                http_client=DefaultAsyncHttpxClient(
-                    http2=False,  # Disable HTTP/2 to rule out Cloud Run edge cases
-                    limits=limits, 
-                    timeout=timeout
-                ),
-            ) as client:
-                response = await client.messages.create(
-                    model=model,
-                    max_tokens=150,
-                    system="You are a helpful assistant that provides factual information about companies. Please do not invent facts, you are allowed to say you don't know.",
-                    messages=[{"role": "user", "content": prompt}],
-                    temperature=temperature
-                )
-                return model, response.content[0].text
-            
+            async with _anthropic_semaphore:
+                result = await _create_anthropic_message(client, prompt, model, temperature, json_schema)
+            _anthropic_breaker["consecutive_failures"] = 0
+            return result
+        
         except Exception as e:
             logger.exception("Anthropic call blew up — full traceback below") 
             
-            # Check if it's a retryable error
-            error_str = str(e).lower()
-            if any(keyword in error_str for keyword in [
-                "connection error", "timeout", "connection refused", 
-                "connection aborted", "connection reset", "network",
-                "overloaded", "rate limit", "resource exhausted", "429"
-            ]):
+            if _is_retryable_anthropic_error(e):
+                _anthropic_breaker["consecutive_failures"] += 1
+                if _anthropic_breaker["consecutive_failures"] >= ANTHROPIC_BREAKER_THRESHOLD:
+                    _anthropic_breaker["open_until"] = time.monotonic() + ANTHROPIC_BREAKER_COOLDOWN_SECONDS
+                    logger.error(f"Anthropic API failed {_anthropic_breaker['consecutive_failures']} times in a row, pausing calls for {ANTHROPIC_BREAKER_COOLDOWN_SECONDS:.0f}s")
+                    raise Exception(f"Connection error, circuit breaker opened: {e}")
                 if attempt < max_attempts - 1:
                     # Exponential backoff with jitter
                     delay = base_delay * (2 ** attempt) + (0.1 * attempt)
@@ -86,11 +206,10 @@ async def query_anthropic(prompt: str, model: str = "claude-3-5-haiku-20241022",
     raise Exception("Maximum retry attempts exceeded")
 
 async def query_gemini(prompt: str, model: str = "gemini-2.0-flash", temperature: float = 0.1):
-    from google import genai
-    from google.genai.types import Tool, GenerateContentConfig, GoogleSearch
-    client = genai.Client(api_key=settings.GEMINI_API_KEY)
+    client = _get_gemini_client()
     google_search_tool = Tool(google_search=GoogleSearch())
-    response = client.models.generate_content(
+    # The async API, so the request does not block the event loop while other providers are queried
+    response = await client.aio.models.generate_content(
         model=model,
         contents=prompt,
         config=GenerateContentConfig(
@@ -101,9 +220,7 @@ async def query_gemini(prompt: str, model: str = "gemini-2.0-flash", temperature
     )
     return model, response.text
 
-async def query_perplexity(prompt: str, model: str = "sonar", temperature: float = 0.1):
-    import httpx
-    
+async def query_perplexity(prompt: str, model: str = "sonar", temperature: float = 0.1, json_schema: Optional[Dict[str, Any]] = None):
     headers = {
         "Authorization": f"Bearer {settings.PERPLEXITY_API_KEY}",
         "Content-Type": "application/json"
@@ -114,7 +231,7 @@ async def query_perplexity(prompt: str, model: str = "sonar", temperature: float
         "messages": [
             {
                 "role": "system",
-                "content": "You are a helpful assistant that provides factual information about companies. Please do not invent facts, you are allowed to say you don't know."
+                "content": COMPANY_FACTS_SYSTEM_PROMPT
             },
             {
                 "role": "user",
@@ -124,14 +241,15 @@ async def query_perplexity(prompt: str, model: str = "sonar", temperature: float
         "temperature": temperature,
         "max_tokens": 150
     }
+    if json_schema:
+        data["response_format"] = {"type": "json_schema", "json_schema": {"schema": json_schema["schema"]}}
     
-    async with httpx.AsyncClient() as client:
-        response = await client.post(
-            "https://api.perplexity.ai/chat/completions",
-            headers=headers,
-            json=data,
-            timeout=30.0
-        )
-        response.raise_for_status()
-        result = response.json()
-        return model, result["choices"][0]["message"]["content"] 
\ No newline at end of file
+    response = await get_http_client().post(
+        PERPLEXITY_API_URL,
+        headers=headers,
+        json=data,
+        timeout=30.0
+    )
+    response.raise_for_status()
+    result = response.json()
+    return model, result["choices"][0]["message"]["content"]
@@ -9,12 +9,15 @@ from bs4 import BeautifulSoup
 import re
 import random
 import asyncio
-from typing import Tuple, Dict, List, Any
+from typing import Tuple, Dict, List, Any, Optional
 from urllib.parse import urljoin, urlparse, urlunparse
 from app.services.analysis.utils.llm_utils import query_openai
+from app.services.analysis.utils.http_utils import get_http_client
+from app.core.config import settings
 import gzip
-import io
 from bs4 import Comment
+from async_lru import alru_cache
+from cachetools import LRUCache, TTLCache
 
 # Playwright imports for JavaScript-enabled scraping
 try:
@@ -30,6 +33,49 @@ try:
 except ImportError:
     BROTLI_AVAILABLE = False
 
+# Faster text extraction for large pages
+try:
+    from selectolax.lexbor import LexborHTMLParser
+    SELECTOLAX_AVAILABLE = True
+except ImportError:
+    SELECTOLAX_AVAILABLE = False
+
+# Disk-backed cache for company facts, shared between workers on the same machine
+try:
+    from diskcache import Cache
+    DISKCACHE_AVAILABLE = True
+except ImportError:
+    DISKCACHE_AVAILABLE = False
+
+# How long robots.txt, sitemap and llms.txt checks are cached, so one site's files are fetched once an hour
+ROBOTS_CACHE_TTL_SECONDS = 60 * 60
+# ETag / Last-Modified validators and the parsed result of the last 200 response per robots.txt or
+# sitemap URL. Once the result cache above expires, the file is revalidated with a conditional
+# request, and a 304 Not Modified reuses the stored result without downloading the file again
+_conditional_results = LRUCache(maxsize=4096)
+
+# Likely redirect stubs: pages this short, or short pages served through an edge CDN that hosts
+# JS-redirect sites, get their www/non-www alternative requested before the stub check finishes
+STUB_RESPONSE_MAX_BYTES = 2 * 1024
+CDN_STUB_RESPONSE_MAX_BYTES = 16 * 1024
+CDN_RESPONSE_HEADERS = ("cf-ray", "x-vercel-id", "x-nf-request-id", "x-amz-cf-id", "x-github-request-id")
+# Hosts that recently served a redirect stub; their alternative is requested alongside the primary URL
+STUB_HOSTS_TTL_SECONDS = 24 * 60 * 60
+_stub_hosts = TTLCache(maxsize=4096, ttl=STUB_HOSTS_TTL_SECONDS)
+
+# lxml's C parser builds the soup much faster than the pure-Python html.parser
+SOUP_PARSER = "lxml"
+
+# Elements whose content is never part of the readable page text
+TEXT_EXCLUDED_TAGS = ['script', 'style', 'noscript', 'meta', 'link', 'head']
+# Elements used for the content-only fallback when the extracted text looks binary
+TEXT_CONTENT_TAGS = ['p', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'li', 'td', 'th', 'div', 'span', 'article', 'section', 'main', 'nav', 'footer', 'header']
+
+# Matches a whole <meta http-equiv="refresh" ...> tag, whatever the attribute order
+_META_REFRESH_RE = re.compile(r'<meta\b[^>]*\bhttp-equiv\s*=\s*["\']?refresh\b[^>]*>', re.IGNORECASE)
+_META_CONTENT_RE = re.compile(r'(?<![\w-])content\s*=\s*(?:"([^"]*)"|\'([^\']*)\')', re.IGNORECASE)
+_REFRESH_URL_RE = re.compile(r'url=(.+)', re.IGNORECASE)
+
 CRAWLER_HEADERS = {
     'User-Agent': 'Mozilla/5.0 (compatible; Googlebot/2.1; +http://www.google.com/bot.html)'
 }
@@ -87,7 +133,73 @@ def _get_conservative_headers() -> Dict[str, str]:
         "Upgrade-Insecure-Requests": "1"
     }
 
-async def scrape_website_conservative(url: str) -> Tuple[BeautifulSoup, str]:
+def _find_meta_refresh_url(html: str) -> str:
+    """
+    Return the target of a meta-refresh redirect found in raw HTML, or an empty string.
+    Works on the response text directly so redirect stubs don't need a full parse.
+    """
+    meta_match = _META_REFRESH_RE.search(html)
+    if not meta_match:
+        return ""
+    content_match = _META_CONTENT_RE.search(meta_match.group(0))
+    if not content_match:
+        return ""
+    content = content_match.group(1) if content_match.group(1) is not None else content_match.group(2)
+    url_match = _REFRESH_URL_RE.search(content)
+    if not url_match:
+        return ""
+    return url_match.group(1).strip().strip('\'"')
+
+def _get_www_alternative_url(url: str) -> str:
+    """Return the www/non-www counterpart of a URL."""
+    parsed = urlparse(url)
+    netloc = parsed.netloc
+    if netloc.startswith("www."):
+        alt_netloc = netloc[4:]
+    else:
+        alt_netloc = "www." + netloc
+    return parsed._replace(netloc=alt_netloc).geturl()
+
+def _is_redirecting_only(soup: BeautifulSoup) -> bool:
+    """Check whether a page is just a 'Redirecting...' stub or has an empty body."""
+    body = soup.body
+    if body and body.get_text(strip=True).lower() in ["redirecting...", "redirecting", ""]:
+        return True
+    return False
+
+async def _fetch_alternative_page(client: httpx.AsyncClient, url: str, headers: Dict[str, str]) -> Optional[httpx.Response]:
+    """
+    Fetch the www/non-www counterpart of url, following a meta-refresh redirect on it.
+    Returns None when the alternative host fails or does not answer with a 2xx page,
+    so the caller keeps the primary page.
+    """
+    try:
+        response = await client.get(_get_www_alternative_url(url), headers=headers)
+        redirect_url = _find_meta_refresh_url(response.text) if response.is_success else ""
+        if redirect_url:
+            response = await client.get(urljoin(str(response.url), redirect_url), headers=headers)
+    except httpx.RequestError as e:
+        print(f"Alternative www/non-www URL failed, keeping the primary page: {e}")
+        return None
+    if not response.is_success:
+        print(f"Alternative www/non-www URL returned {response.status_code}, keeping the primary page")
+        return None
+    return response
+
+def _is_likely_stub_response(response: httpx.Response) -> bool:
+    """Guess from its size and CDN headers whether a response is a redirect stub, before parsing it."""
+    size = len(response.content)
+    if size < STUB_RESPONSE_MAX_BYTES:
+        return True
+    return size < CDN_STUB_RESPONSE_MAX_BYTES and any(header in response.headers for header in CDN_RESPONSE_HEADERS)
+
+async def _discard_task(task: Optional[asyncio.Task]) -> None:
+    """Cancel a speculative request that is no longer needed and wait for it to finish."""
+    if task is not None and not task.done():
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+
+async def scrape_website_conservative(url: str) -> Tuple[BeautifulSoup, str, bytes]:
     """
     Conservative scraping approach for heavily protected websites.
     Uses minimal headers and longer delays.
@@ -116,18 +228,18 @@ async def scrape_website_conservative(url: str) -> Tuple[BeautifulSoup, str]:
             response = await client.get(url, headers=headers)
             response.raise_for_status()
             
-            soup = BeautifulSoup(response.text, "html.parser")
-            all_text = _extract_clean_text(soup)
+            soup = BeautifulSoup(response.text, SOUP_PARSER)
+            all_text = _extract_clean_text(soup, response.text)
             
-            return soup, all_text
+            return soup, all_text, response.text.encode("utf-8")
             
     except Exception as e:
         print(f"Conservative scraping also failed: {str(e)}")
         raise
 
-async def scrape_website(url: str, max_retries: int = 3) -> Tuple[BeautifulSoup, str]:
+async def scrape_website(url: str, max_retries: int = 3) -> Tuple[BeautifulSoup, str, bytes]:
     """
-    Scrape a website and return the BeautifulSoup object and extracted text.
+    Scrape a website and return the BeautifulSoup object, extracted text and page markup.
     Handles redirects, www vs non-www variations, and includes anti-bot detection measures.
     
     Args:
@@ -138,6 +250,8 @@ async def scrape_website(url: str, max_retries: int = 3) -> Tuple[BeautifulSoup,
         Tuple containing:
         - soup: BeautifulSoup object of the parsed HTML
         - all_text: Extracted text content from the website
+        - html_bytes: The page HTML, UTF-8 encoded, so analyzers can parse it without
+          re-serializing the soup
     """
     
     # Extended timeout settings for better stability
@@ -169,72 +283,74 @@ async def scrape_website(url: str, max_retries: int = 3) -> Tuple[BeautifulSoup,
             ) as client:
                 print(f"Attempting to scrape {url} (attempt {attempt + 1}/{max_retries})")
                 
-                response = await client.get(url, headers=headers)
-                response.raise_for_status()  # Raise an exception for bad status codes
-                
-                # Check for potential encoding issues as fallback
-                content_encoding = response.headers.get('content-encoding', '').lower()
-                is_brotli = 'br' in content_encoding or 'brotli' in content_encoding
-                
-                # Fallback: Check if response looks like binary data that needs manual decompression
-                if len(response.text) > 0:
-                    binary_chars = sum(1 for c in response.text[:200] if ord(c) < 32 and ord(c) not in [9, 10, 13])
-                    if binary_chars > 20:  # High ratio of control characters suggests decompression failed
-                        if is_brotli and BROTLI_AVAILABLE:
-                            try:
-                                # Manual brotli decompression as fallback
-                                raw_content = response.content
-                                decompressed_content = brotli.decompress(raw_content)
-                                decoded_text = decompressed_content.decode('utf-8', errors='ignore')
-                                response._text = decoded_text
-                            except Exception:
-                                pass  # Continue with original response if decompression fails
-                        elif is_brotli and not BROTLI_AVAILABLE:
-                            print(f"Warning: Brotli compression detected but brotli module not available. Install with: pip install brotli")
-                
-                soup = BeautifulSoup(response.text, "html.parser")
-
-                # Handle meta-refresh redirects
-                meta = soup.find("meta", attrs={"http-equiv": re.compile("^refresh$", re.I)})
-                if meta:
-                    content = meta.get("content", "")
-                    match = re.search(r'url=(.+)', content, re.IGNORECASE)
-                    if match:
-                        redirect_url = match.group(1).strip()
+                # A host that served a redirect stub recently is raced against its www/non-www
+                # alternative from the start; the alternative is only used if the primary is a stub again
+                host = urlparse(url).netloc.lower()
+                alt_task = None
+                if host in _stub_hosts:
+                    alt_task = asyncio.create_task(_fetch_alternative_page(client, url, headers))
+                try:
+                    response = await client.get(url, headers=headers)
+                    response.raise_for_status()  # Raise an exception for bad status codes
+                    
+                    # Check for potential encoding issues as fallback
+                    content_encoding = response.headers.get('content-encoding', '').lower()
+                    is_brotli = 'br' in content_encoding or 'brotli' in content_encoding
+                    
+                    # Fallback: Check if response looks like binary data that needs manual decompression
+                    if len(response.text) > 0:
+                        binary_chars = sum(1 for c in response.text[:200] if ord(c) < 32 and ord(c) not in [9, 10, 13])
+                        if binary_chars > 20:  # High ratio of control characters suggests decompression failed
+                            if is_brotli and BROTLI_AVAILABLE:
+                                try:
+                                    # Manual brotli decompression as fallback
+                                    raw_content = response.content
+                                    decompressed_content = brotli.decompress(raw_content)
+                                    decoded_text = decompressed_content.decode('utf-8', errors='ignore')
+                                    response._text = decoded_text
+                                except Exception:
+                                    pass  # Continue with original response if decompression fails
+                            elif is_brotli and not BROTLI_AVAILABLE:
+                                print(f"Warning: Brotli compression detected but brotli module not available. Install with: pip install brotli")
+                    
+                    # A likely stub gets its alternative requested now, so the request overlaps the
+                    # meta-refresh follow and the parse instead of starting after them
+                    if alt_task is None and _is_likely_stub_response(response):
+                        alt_task = asyncio.create_task(_fetch_alternative_page(client, url, headers))
+                    
+                    # Handle meta-refresh redirects straight from the raw HTML so the
+                    # stub page is never parsed into a soup
+                    redirect_url = _find_meta_refresh_url(response.text)
+                    if redirect_url:
                         redirect_url = urljoin(str(response.url), redirect_url)
                         # Add small delay before following redirect
                         await asyncio.sleep(random.uniform(1.0, 2.0))
                         response = await client.get(redirect_url, headers=headers)
-                        soup = BeautifulSoup(response.text, "html.parser")
-
-                # Check for 'Redirecting...' or empty content, and try alternative www/non-www
-                def is_redirecting_only(soup):
-                    body = soup.body
-                    if body and body.get_text(strip=True).lower() in ["redirecting...", "redirecting", ""]:
-                        return True
-                    return False
-
-                tried_alternative = False
-                while is_redirecting_only(soup) and not tried_alternative:
-                    parsed = urlparse(url)
-                    netloc = parsed.netloc
-                    if netloc.startswith("www."):
-                        alt_netloc = netloc[4:]
-                    else:
-                        alt_netloc = "www." + netloc
-                    alt_url = parsed._replace(netloc=alt_netloc).geturl()
-                    # Add small delay before trying alternative
-                    await asyncio.sleep(random.uniform(1.0, 2.0))
-                    response = await client.get(alt_url, headers=headers)
-                    soup = BeautifulSoup(response.text, "html.parser")
-                    tried_alternative = True
-                
-                # Extract clean text content for analysis
-                all_text = _extract_clean_text(soup)
-                
-                # Success! Return the results
-                return soup, all_text
-                        
+
+                    soup = BeautifulSoup(response.text, SOUP_PARSER)
+
+                    # Check for 'Redirecting...' or empty content, and try the alternative www/non-www.
+                    # Only a successful alternative page replaces the primary one
+                    if _is_redirecting_only(soup):
+                        _stub_hosts[host] = True
+                        if alt_task is None:
+                            # Add small delay before trying alternative
+                            await asyncio.sleep(random.uniform(1.0, 2.0))
+                            alt_task = asyncio.create_task(_fetch_alternative_page(client, url, headers))
+                        alt_response = await alt_task
+                        if alt_response is not None:
+                            response = alt_response
+                            soup = BeautifulSoup(response.text, SOUP_PARSER)
+                    
+                    # Extract clean text content for analysis
+                    all_text = _extract_clean_text(soup, response.text)
+                    
+                    # Success! Return the results
+                    return soup, all_text, response.text.encode("utf-8")
+                finally:
+                    # Not a stub after all, or the attempt failed: drop the speculative request
+                    await _discard_task(alt_task)
+                    
         except httpx.TimeoutException as e:
             last_exception = e
             print(f"Timeout error while scraping {url} (attempt {attempt + 1}): {str(e)}")
@@ -345,10 +461,10 @@ async def scrape_website_with_js(url: str, wait_time: int = 5000) -> Tuple[Beaut
             html_content = await page.content()
             
             # Parse with BeautifulSoup
-            soup = BeautifulSoup(html_content, "html.parser")
+            soup = BeautifulSoup(html_content, SOUP_PARSER)
             
             # Extract clean text
-            all_text = _extract_clean_text(soup)
+            all_text = _extract_clean_text(soup, html_content)
             
             print(f"JavaScript scraping successful. HTML length: {len(html_content)}")
             
@@ -397,7 +513,7 @@ async def scrape_website_adaptive(url: str, max_retries: int = 3) -> Tuple[Beaut
     
     try:
         # Fallback to regular scraping
-        soup, text = await scrape_website(url, max_retries)
+        soup, text, _ = await scrape_website(url, max_retries)
         
         # Check if the content looks complete
         has_head = soup.find('head') is not None
@@ -473,14 +589,14 @@ async def scrape_website_browser_like(url: str) -> Tuple[BeautifulSoup, str]:
             response = await client.get(url, headers=headers)
             response.raise_for_status()
             
-            soup = BeautifulSoup(response.text, "html.parser")
+            soup = BeautifulSoup(response.text, SOUP_PARSER)
             
             # Check if we got the complete HTML BEFORE extracting text
             has_head = soup.find('head') is not None
             has_doctype = '<!DOCTYPE' in response.text[:100]
             
             # Extract clean text (this should not modify the original soup)
-            all_text = _extract_clean_text(soup)
+            all_text = _extract_clean_text(soup, response.text)
             
             print(f"Browser-like scraping result:")
             print(f"  - HTML length: {len(response.text)}")
@@ -494,33 +610,50 @@ async def scrape_website_browser_like(url: str) -> Tuple[BeautifulSoup, str]:
         print(f"Browser-like scraping failed: {str(e)}")
         raise
 
-def _extract_clean_text(soup: BeautifulSoup) -> str:
+def _extract_clean_text(soup: BeautifulSoup, html: str = None) -> str:
     """
     Extract clean, readable text from BeautifulSoup object.
     Filters out binary content, scripts, and non-printable characters.
-    Note: This function works on a copy to avoid modifying the original soup.
+    When the raw HTML is given and selectolax is available, the text is extracted
+    from a separate selectolax tree instead, which is much faster on large pages.
+    Note: This function never modifies the original soup.
     """
-    # Work on a copy to avoid modifying the original soup
-    import copy
-    soup_copy = copy.deepcopy(soup)
-    
-    # Remove problematic elements that often contain binary/encoded content
-    for element in soup_copy(['script', 'style', 'noscript', 'meta', 'link', 'head']):
-        element.decompose()
-    
-    # Remove HTML comments
-    comments = soup_copy.find_all(string=lambda text: isinstance(text, Comment))
-    for comment in comments:
-        comment.extract()
-    
-    # Remove elements with data URIs (often contain base64 encoded binary data)
-    for element in soup_copy.find_all(attrs={'src': re.compile(r'^data:', re.I)}):
-        element.decompose()
-    for element in soup_copy.find_all(attrs={'href': re.compile(r'^data:', re.I)}):
-        element.decompose()
-    
-    # Extract text from remaining elements
-    all_text = soup_copy.get_text(separator=' ', strip=True)
+    if html is not None and SELECTOLAX_AVAILABLE:
+        tree = LexborHTMLParser(html)
+        
+        # Remove problematic elements that often contain binary/encoded content
+        tree.strip_tags(TEXT_EXCLUDED_TAGS)
+        
+        # Remove elements with data URIs (often contain base64 encoded binary data)
+        for node in tree.css('[src^="data:" i], [href^="data:" i]'):
+            node.decompose()
+        
+        # Extract text from remaining elements (comments are never part of the text)
+        all_text = tree.root.text(separator=' ', strip=True) if tree.root else ""
+        get_content_texts = lambda: [node.text(strip=True) for node in tree.css(", ".join(TEXT_CONTENT_TAGS))]
+    else:
+        # Work on a copy to avoid modifying the original soup
+        import copy
+        soup_copy = copy.deepcopy(soup)
+        
+        # Remove problematic elements that often contain binary/encoded content
+        for element in soup_copy(TEXT_EXCLUDED_TAGS):
+            element.decompose()
+        
+        # Remove HTML comments
+        comments = soup_copy.find_all(string=lambda text: isinstance(text, Comment))
+        for comment in comments:
+            comment.extract()
+        
+        # Remove elements with data URIs (often contain base64 encoded binary data)
+        for element in soup_copy.find_all(attrs={'src': re.compile(r'^data:', re.I)}):
+            element.decompose()
+        for element in soup_copy.find_all(attrs={'href': re.compile(r'^data:', re.I)}):
+            element.decompose()
+        
+        # Extract text from remaining elements
+        all_text = soup_copy.get_text(separator=' ', strip=True)
+        get_content_texts = lambda: [element.get_text(strip=True) for element in soup_copy.find_all(TEXT_CONTENT_TAGS)]
     
     # More robust character filtering
     # Remove control characters and other problematic characters, but keep Unicode letters/digits
@@ -545,22 +678,19 @@ def _extract_clean_text(soup: BeautifulSoup) -> str:
                  + " falling back to content-only extraction")
             
             # Try to extract only from common content elements
-            content_elements = soup_copy.find_all(['p', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'li', 'td', 'th', 'div', 'span', 'article', 'section', 'main', 'nav', 'footer', 'header'])
-            if content_elements:
-                content_texts = []
-                for element in content_elements:
-                    element_text = element.get_text(strip=True)
-                    # Apply same cleaning to element text
-                    element_text = re.sub(r'[\x00-\x08\x0B\x0C\x0E-\x1F\x7F-\x9F]', '', element_text)
-                    element_text = re.sub(r'[\t\n\r]', ' ', element_text)
-                    element_text = re.sub(r'\s+', ' ', element_text).strip()
-                    
-                    # Only include meaningful text chunks
-                    if element_text and len(element_text) > 3:
-                        content_texts.append(element_text)
+            content_texts = []
+            for element_text in get_content_texts():
+                # Apply same cleaning to element text
+                element_text = re.sub(r'[\x00-\x08\x0B\x0C\x0E-\x1F\x7F-\x9F]', '', element_text)
+                element_text = re.sub(r'[\t\n\r]', ' ', element_text)
+                element_text = re.sub(r'\s+', ' ', element_text).strip()
                 
-                if content_texts:
-                    clean_text = ' '.join(content_texts)
+                # Only include meaningful text chunks
+                if element_text and len(element_text) > 3:
+                    content_texts.append(element_text)
+            
+            if content_texts:
+                clean_text = ' '.join(content_texts)
     
     return clean_text
 
@@ -926,7 +1056,70 @@ def extract_company_name(soup: BeautifulSoup, url: str) -> str:
     # Return the first name as fallback (already domain-cleaned)
     return cleaned_names[0]
 
+# Opened on first use rather than at import, so importing this module creates no cache directory
+_company_facts_cache = None
+_company_facts_cache_failed = False
+
+def _get_company_facts_cache():
+    """Return the company facts disk cache, opening it on first use, or None when it is unavailable."""
+    global _company_facts_cache, _company_facts_cache_failed
+    if _company_facts_cache is None and DISKCACHE_AVAILABLE and not _company_facts_cache_failed:
+        try:
+            _company_facts_cache = Cache(settings.SCRAPE_CACHE_DIR, size_limit=settings.SCRAPE_CACHE_SIZE_LIMIT_BYTES)
+        except Exception as e:
+            print(f"Warning: Company facts cache disabled: {e}")
+            _company_facts_cache_failed = True
+    return _company_facts_cache
+
+def close_company_facts_cache() -> None:
+    """Close the company facts disk cache if it was opened; called on application shutdown."""
+    global _company_facts_cache
+    if _company_facts_cache is not None:
+        _company_facts_cache.close()
+        _company_facts_cache = None
+
+def _normalize_url_for_cache(url: str) -> str:
+    """
+    Normalize a URL into a cache key so trivially different spellings of the
+    same site (scheme, case, www prefix, trailing slash, fragment) share an entry.
+    """
+    parsed = urlparse(url if url.startswith(('http://', 'https://')) else f"https://{url}")
+    netloc = parsed.netloc.lower()
+    if netloc.startswith("www."):
+        netloc = netloc[4:]
+    path = parsed.path.rstrip("/")
+    return urlunparse(("", netloc, path, "", parsed.query, "")).lstrip("/")
+
 async def scrape_company_facts(url: str, soup: BeautifulSoup, all_text: str) -> dict:
+    """
+    Extract company facts (name, industry, key products/services, description) for a website.
+    Results are cached on disk by normalized URL, so repeated analyses of the same site
+    skip the extraction and any LLM fallback call.
+    """
+    cache_key = _normalize_url_for_cache(url)
+    facts_cache = _get_company_facts_cache()
+    if facts_cache is not None:
+        try:
+            cached_facts = facts_cache.get(cache_key)
+            if cached_facts:
+                print(f"Using cached company facts for {url}")
+                return cached_facts
+        except Exception as e:
+            print(f"Warning: Could not read company facts cache: {e}")
+    
+    company_facts = await _scrape_company_facts_uncached(url, soup, all_text)
+    
+    # Only cache complete results, so a failed extraction or LLM fallback is retried next time
+    is_complete = company_facts["name"] and (company_facts["industry"] or company_facts["key_products_services"])
+    if facts_cache is not None and is_complete:
+        try:
+            facts_cache.set(cache_key, company_facts, expire=settings.SCRAPE_CACHE_TTL_SECONDS)
+        except Exception as e:
+            print(f"Warning: Could not write company facts cache: {e}")
+    
+    return company_facts
+
+async def _scrape_company_facts_uncached(url: str, soup: BeautifulSoup, all_text: str) -> dict:
     # Extract name using the new dedicated function
     name = extract_company_name(soup, url)
 
@@ -1021,9 +1214,34 @@ def get_company_facts_aeo_checker(url: str) -> dict:
         "description": "AEO Checker helps you analyze and optimize your web content for modern search engines and AI-powered answer engines. Improve your rankings and visibility.",
     }
 
+def _add_conditional_headers(url: str, headers: Dict[str, str]) -> Optional[Tuple[Optional[str], Optional[str], Any]]:
+    """
+    Add If-None-Match / If-Modified-Since to headers from the validators stored for url.
+    Returns the stored (etag, last_modified, result) entry, or None when there is none. A 304
+    must be answered from this entry: by the time the response arrives, the LRU may have evicted it.
+    """
+    stored = _conditional_results.get(url)
+    if stored is None:
+        return None
+    etag, last_modified, _ = stored
+    if etag:
+        headers["If-None-Match"] = etag
+    if last_modified:
+        headers["If-Modified-Since"] = last_modified
+    return stored
+
+def _store_conditional_result(url: str, response: httpx.Response, result: Any) -> None:
+    """Remember the validators of a 200 response for url along with its parsed result."""
+    etag = response.headers.get("etag")
+    last_modified = response.headers.get("last-modified")
+    if response.status_code == 200 and (etag or last_modified):
+        _conditional_results[url] = (etag, last_modified, result)
+
 async def check_robots_txt(url: str) -> Tuple[bool, List[str]]:
     """
     Check for robots.txt file and extract sitemap URLs.
+    Results are cached per robots.txt URL for ROBOTS_CACHE_TTL_SECONDS, so analyses of
+    pages on the same site fetch it once.
     
     Args:
         url: The base URL to check
@@ -1038,112 +1256,127 @@ async def check_robots_txt(url: str) -> Tuple[bool, List[str]]:
     base_url = urlunparse((parsed_url.scheme, parsed_url.netloc, '', '', '', ''))
     
     robots_url = urljoin(base_url, '/robots.txt')
+    
+    try:
+        exists, sitemap_urls = await _fetch_robots_txt(robots_url)
+    except Exception as e:
+        print(f"Warning: Could not fetch robots.txt: {e}")
+        return False, []
+    
+    return exists, list(sitemap_urls)
+
+@alru_cache(maxsize=4096, ttl=ROBOTS_CACHE_TTL_SECONDS)
+async def _fetch_robots_txt(robots_url: str) -> Tuple[bool, Tuple[str, ...]]:
+    """
+    Fetch a robots.txt file and return (exists, sitemap URLs) for check_robots_txt.
+    Failed requests raise and are therefore not cached.
+    """
     sitemap_urls = []
     exists = False
     
     # Use randomized headers for better bot avoidance
     headers = _get_random_headers()
+    stored = _add_conditional_headers(robots_url, headers)
     
-    try:
-        async with httpx.AsyncClient() as client:
-            response = await client.get(robots_url, headers=headers, timeout=10, follow_redirects=True)
-            if response.status_code == 200:
-                exists = True
-                
-                # Check if content is compressed
-                content_type = response.headers.get('content-type', '').lower()
-                content_encoding = response.headers.get('content-encoding', '').lower()
-                
-                # Get the content
-                content = response.content
-                
-                # Check for different compression types
-                is_gzipped = (
-                    'gzip' in content_type or 
-                    'gzip' in content_encoding or
-                    'application/x-gzip' in content_type
-                )
-                
-                is_brotli = (
-                    'br' in content_encoding or
-                    'brotli' in content_encoding
-                )
-                
-                # Decompress if compressed
-                if is_brotli and BROTLI_AVAILABLE:
-                    try:
-                        content = brotli.decompress(content)
-                    except Exception as e:
-                        print(f"Warning: Failed to decompress brotli robots.txt: {e}")
-                        # Try to use response.text as fallback
-                        robots_text = response.text
-                elif is_gzipped:
-                    try:
-                        content = gzip.decompress(content)
-                    except Exception as e:
-                        print(f"Warning: Failed to decompress gzipped robots.txt: {e}")
-                        # Try to use response.text as fallback
-                        robots_text = response.text
-                
-                # Convert decompressed content to text
-                if (is_brotli and BROTLI_AVAILABLE) or is_gzipped:
-                    if isinstance(content, bytes):
-                        try:
-                            robots_text = content.decode('utf-8')
-                        except UnicodeDecodeError:
-                            try:
-                                robots_text = content.decode('latin-1')
-                            except UnicodeDecodeError:
-                                print(f"Warning: Could not decode robots.txt content")
-                                robots_text = response.text  # Fallback
-                    else:
-                        robots_text = response.text  # Already text
-                else:
-                    # No compression or no brotli support - use response.text or decode manually
-                    if is_brotli and not BROTLI_AVAILABLE:
-                        print(f"Warning: Brotli compression detected but brotli module not available")
-                    
-                    # Convert to text
+    response = await get_http_client().get(robots_url, headers=headers, timeout=10, follow_redirects=True)
+    if response.status_code == 304 and stored is not None:
+        return stored[2]
+    if response.status_code == 200:
+        exists = True
+        
+        # Check if content is compressed
+        content_type = response.headers.get('content-type', '').lower()
+        content_encoding = response.headers.get('content-encoding', '').lower()
+        
+        # Get the content
+        content = response.content
+        
+        # Check for different compression types
+        is_gzipped = (
+            'gzip' in content_type or 
+            'gzip' in content_encoding or
+            'application/x-gzip' in content_type
+        )
+        
+        is_brotli = (
+            'br' in content_encoding or
+            'brotli' in content_encoding
+        )
+        
+        # Decompress if compressed
+        if is_brotli and BROTLI_AVAILABLE:
+            try:
+                content = brotli.decompress(content)
+            except Exception as e:
+                print(f"Warning: Failed to decompress brotli robots.txt: {e}")
+                # Try to use response.text as fallback
+                robots_text = response.text
+        elif is_gzipped:
+            try:
+                content = gzip.decompress(content)
+            except Exception as e:
+                print(f"Warning: Failed to decompress gzipped robots.txt: {e}")
+                # Try to use response.text as fallback
+                robots_text = response.text
+        
+        # Convert decompressed content to text
+        if (is_brotli and BROTLI_AVAILABLE) or is_gzipped:
+            if isinstance(content, bytes):
+                try:
+                    robots_text = content.decode('utf-8')
+                except UnicodeDecodeError:
                     try:
-                        robots_text = content.decode('utf-8')
+                        robots_text = content.decode('latin-1')
                     except UnicodeDecodeError:
-                        try:
-                            robots_text = content.decode('latin-1')
-                        except UnicodeDecodeError:
-                            robots_text = response.text  # Fallback to response.text
-                
-                # Extract Sitemap directives
-                robots_content = robots_text.splitlines()
-                
-                # Method 1: Standard sitemap parsing
-                for line in robots_content:
-                    line_clean = line.strip()
-                    if line_clean.lower().startswith('sitemap:'):
-                        # Use line_clean instead of line for splitting
-                        sitemap_url = line_clean.split(':', 1)[1].strip()
-                        sitemap_urls.append(sitemap_url)
-                
-                # Method 2: Look for any line containing .xml (fallback)
-                for line in robots_content:
-                    line_clean = line.strip()
-                    if '.xml' in line_clean.lower():
-                        # Try to extract URL-like patterns
-                        # Look for http/https URLs containing .xml
-                        import re
-                        url_pattern = r'https?://[^\s]+\.xml[^\s]*'
-                        matches = re.findall(url_pattern, line_clean, re.IGNORECASE)
-                        for match in matches:
-                            if match not in sitemap_urls:
-                                sitemap_urls.append(match)
-                
-    except Exception as e:
-        print(f"Warning: Could not fetch robots.txt: {e}")
-    
-    return exists, sitemap_urls
+                        print(f"Warning: Could not decode robots.txt content")
+                        robots_text = response.text  # Fallback
+            else:
+                robots_text = response.text  # Already text
+        else:
+            # No compression or no brotli support - use response.text or decode manually
+            if is_brotli and not BROTLI_AVAILABLE:
+                print(f"Warning: Brotli compression detected but brotli module not available")
+            
+            # Convert to text
+            try:
+                robots_text = content.decode('utf-8')
+            except UnicodeDecodeError:
+                try:
+                    robots_text = content.decode('latin-1')
+                except UnicodeDecodeError:
+                    robots_text = response.text  # Fallback to response.text
+        
+        # Extract Sitemap directives
+        robots_content = robots_text.splitlines()
+        
+        # Method 1: Standard sitemap parsing
+        for line in robots_content:
+            line_clean = line.strip()
+            if line_clean.lower().startswith('sitemap:'):
+                # Use line_clean instead of line for splitting
+                sitemap_url = line_clean.split(':', 1)[1].strip()
+                sitemap_urls.append(sitemap_url)
+        
+        # Method 2: Look for any line containing .xml (fallback)
+        for line in robots_content:
+            line_clean = line.strip()
+            if '.xml' in line_clean.lower():
+                # Try to extract URL-like patterns
+                # Look for http/https URLs containing .xml
+                url_pattern = r'https?://[^\s]+\.xml[^\s]*'
+                matches = re.findall(url_pattern, line_clean, re.IGNORECASE)
+                for match in matches:
+                    if match not in sitemap_urls:
+                        sitemap_urls.append(match)
+    
+    result = (exists, tuple(sitemap_urls))
+    _store_conditional_result(robots_url, response, result)
+    return result
 
 async def is_valid_sitemap(url: str) -> bool:
     """
     Check if a URL points to a valid sitemap XML file.
+    Results are cached per URL for ROBOTS_CACHE_TTL_SECONDS.
     
     Args:
         url: The URL to check
@@ -1152,60 +1385,116 @@ async def is_valid_sitemap(url: str) -> bool:
         Boolean indicating if the URL is a valid sitemap
     """
     try:
-        # Use randomized headers for better bot avoidance
-        headers = _get_random_headers()
-        async with httpx.AsyncClient() as client:
-            response = await client.get(url, headers=headers, timeout=10, follow_redirects=True)
-            
-            # Check if the response is successful
-            if response.status_code < 400:
-                # Check content type
-                content_type = response.headers.get('content-type', '').lower()
-                
-                # Get the content
-                content = response.content
-                
-                # Check if the content is gzipped (either by content-type or URL extension)
-                is_gzipped = (
-                    'gzip' in content_type or 
-                    'application/x-gzip' in content_type or
-                    url.lower().endswith('.gz')
-                )
-                
-                # Decompress if gzipped
-                if is_gzipped:
-                    try:
-                        content = gzip.decompress(content)
-                    except Exception as e:
-                        print(f"Warning: Failed to decompress gzipped content for {url}: {e}")
-                        return False
-                
-                # Convert to text
-                try:
-                    content_text = content.decode('utf-8')
-                except UnicodeDecodeError:
-                    # Try other encodings
-                    try:
-                        content_text = content.decode('latin-1')
-                    except UnicodeDecodeError:
-                        print(f"Warning: Could not decode content for {url}")
-                        return False
-                
-                # Check if it's valid XML content type (after decompression)
-                if any(x in content_type for x in ['application/xml', 'text/xml']) or is_gzipped:
-                    # Verify that it contains sitemap-specific elements
-                    is_sitemap = bool(re.search(r'<\s*(urlset|sitemapindex)[^>]*>', content_text))
-                    
-                    # Additional check for URL entries
-                    has_urls = bool(re.search(r'<\s*url\s*>|<\s*sitemap\s*>', content_text))
-                    
-                    return is_sitemap and has_urls
-                    
-            return False
+        return await _fetch_is_valid_sitemap(url)
     except Exception as e:
         print(f"Warning: Failed to validate sitemap at {url}: {e}")
         return False
 
+@alru_cache(maxsize=4096, ttl=ROBOTS_CACHE_TTL_SECONDS)
+async def _fetch_is_valid_sitemap(url: str) -> bool:
+    """
+    Fetch a candidate sitemap and check its content for is_valid_sitemap.
+    Failed requests raise and are therefore not cached.
+    """
+    # Use randomized headers for better bot avoidance
+    headers = _get_random_headers()
+    stored = _add_conditional_headers(url, headers)
+    response = await get_http_client().get(url, headers=headers, timeout=10, follow_redirects=True)
+    if response.status_code == 304 and stored is not None:
+        return stored[2]
+    
+    is_valid = _is_sitemap_response(url, response)
+    _store_conditional_result(url, response, is_valid)
+    return is_valid
+
+def _is_sitemap_response(url: str, response: httpx.Response) -> bool:
+    """Check whether a fetched candidate sitemap response holds a valid sitemap."""
+    # Check if the response is successful
+    if response.status_code < 400:
+        # Check content type
+        content_type = response.headers.get('content-type', '').lower()
+        
+        # Get the content
+        content = response.content
+        
+        # Check if the content is gzipped (either by content-type or URL extension)
+        is_gzipped = (
+            'gzip' in content_type or 
+            'application/x-gzip' in content_type or
+            url.lower().endswith('.gz')
+        )
+        
+        # Decompress if gzipped
+        if is_gzipped:
+            try:
+                content = gzip.decompress(content)
+            except Exception as e:
+                print(f"Warning: Failed to decompress gzipped content for {url}: {e}")
+                return False
+        
+        # Convert to text
+        try:
+            content_text = content.decode('utf-8')
+        except UnicodeDecodeError:
+            # Try other encodings
+            try:
+                content_text = content.decode('latin-1')
+            except UnicodeDecodeError:
+                print(f"Warning: Could not decode content for {url}")
+                return False
+        
+        # Check if it's valid XML content type (after decompression)
+        if any(x in content_type for x in ['application/xml', 'text/xml']) or is_gzipped:
+            # Verify that it contains sitemap-specific elements
+            is_sitemap = bool(re.search(r'<\s*(urlset|sitemapindex)[^>]*>', content_text))
+            
+            # Additional check for URL entries
+            has_urls = bool(re.search(r'<\s*url\s*>|<\s*sitemap\s*>', content_text))
+            
+            return is_sitemap and has_urls
+            
+    return False
+
+async def file_exists(file_url: str) -> bool:
+    """
+    Return True if a HEAD request for the file answers 200; errors count as not found.
+    Results are cached per URL for ROBOTS_CACHE_TTL_SECONDS.
+    """
+    try:
+        return await _fetch_file_exists(file_url)
+    except Exception:
+        return False  # File not found or error accessing it
+
+@alru_cache(maxsize=4096, ttl=ROBOTS_CACHE_TTL_SECONDS)
+async def _fetch_file_exists(file_url: str) -> bool:
+    """
+    Send the HEAD request for file_exists. Failed requests raise and are therefore not cached.
+    """
+    response = await get_http_client().head(file_url, timeout=5.0)
+    return response.status_code == 200
+
+async def has_valid_sitemap(urls: List[str]) -> bool:
+    """
+    Check candidate sitemap URLs concurrently and return True as soon as one is valid.
+    
+    Args:
+        urls: The candidate sitemap URLs
+        
+    Returns:
+        Boolean indicating if any URL is a valid sitemap. The checks still running
+        when one succeeds are cancelled.
+    """
+    tasks = [asyncio.create_task(is_valid_sitemap(s_url)) for s_url in urls]
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            if await next_done:
+                return True
+        return False
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
 async def get_potential_sitemap_urls(url: str) -> List[str]:
     """
     Get a list of potential sitemap URLs for a website.
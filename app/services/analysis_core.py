@@ -60,12 +60,12 @@ class AnalysisService:
                 return
             
             # Step 2: Scrape website & company facts (progress 0.25)
-            soup, all_text, company_facts = await cls._scrape_website_data(job_id, validated_url, job_ref)
+            soup, all_text, html_bytes, company_facts = await cls._scrape_website_data(job_id, validated_url, job_ref)
             if not company_facts:
                 return
             
             # Step 3: Run analyses in parallel (progress +0.25 each)
-            analysis_scores, analysis_results = await cls._run_parallel_analyses(job_id, company_facts, validated_url, soup, all_text, job_ref)
+            analysis_scores, analysis_results = await cls._run_parallel_analyses(job_id, company_facts, validated_url, soup, all_text, html_bytes, job_ref)
             if not analysis_scores:
                 return
             
@@ -158,7 +158,7 @@ class AnalysisService:
         """Scrape website content and extract company facts."""
         try:
             # Scrape website
-            soup, all_text = await scrape_website(url)
+            soup, all_text, html_bytes = await scrape_website(url)
             print(f"Scraped website for job {job_id}")
             
             if soup is None:
@@ -168,7 +168,7 @@ class AnalysisService:
                     "error": "Failed to scrape website. Please try again later.",
                     "completed_at": datetime.now().isoformat()
                 })
-                return None, None, None
+                return None, None, None, None
                 
         except Exception as e:
             error_message = str(e)
@@ -182,7 +182,7 @@ class AnalysisService:
                 "error_details": error_message,
                 "completed_at": datetime.now().isoformat()
             })
-            return None, None, None
+            return None, None, None, None
         
         try:
             # Extract company facts
@@ -202,7 +202,7 @@ class AnalysisService:
                     "error": "No information found about your website. You need to add name tags, meta tags, and other basic structured data to your website to run this analysis.",
                     "completed_at": datetime.now().isoformat()
                 })
-                return None, None, None
+                return None, None, None, None
             
         except Exception as e:
             print(f"Error extracting company facts for job {job_id}: {str(e)}")
@@ -212,15 +212,15 @@ class AnalysisService:
                 "error_details": str(e),
                 "completed_at": datetime.now().isoformat()
             })
-            return None, None, None
+            return None, None, None, None
         
         job_ref.update({"progress": 0.25})
         print(f"Progress updated to 0.25 for job {job_id}")
         
-        return soup, all_text, company_facts
+        return soup, all_text, html_bytes, company_facts
 
     @classmethod
-    async def _run_parallel_analyses(cls, job_id: str, company_facts: dict, url: str, soup, all_text: str, job_ref) -> tuple:
+    async def _run_parallel_analyses(cls, job_id: str, company_facts: dict, url: str, soup, all_text: str, html_bytes: bytes, job_ref) -> tuple:
         """Run all three analyses in parallel and track progress."""
         # Instantiate analyzers
         ai_presence_analyzer = AiPresenceAnalyzer()
@@ -232,7 +232,7 @@ class AnalysisService:
             "ai_presence": asyncio.create_task(ai_presence_analyzer.analyze(company_facts)),
             "competitor_landscape": asyncio.create_task(competitor_landscape_analyzer.analyze(company_facts)),
             "strategy_review": asyncio.create_task(
-                strategy_review_analyzer.analyze(company_facts["name"], url, soup, all_text)
+                strategy_review_analyzer.analyze(company_facts["name"], url, soup, all_text, html_bytes=html_bytes)
             ),
         }
         task_to_name = {task: name for name, task in tasks.items()}
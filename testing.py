@@ -27,7 +27,7 @@ async def main():
     }
 
     print("About to scrape website...")
-    soup, all_text = await scrape_website(validated_url)
+    soup, all_text, html_bytes = await scrape_website(validated_url)
 
     # company_facts = await scrape_company_facts(validated_url, soup, all_text)
     # competitor_landscape_score, competitors_result = await competitor_landscape_analyzer.analyze(company_facts)
@@ -35,14 +35,14 @@ async def main():
     # print(competitor_landscape_score)
     # print(competitors_result.model_dump_json(indent=4))
 
-    # accessibility_score, accessibility_results = await strategy_review_analyzer.analyze(dummy_company_facts["name"], validated_url, soup, all_text)
+    # accessibility_score, accessibility_results = await strategy_review_analyzer.analyze(dummy_company_facts["name"], validated_url, soup, all_text, html_bytes)
     # print("Accessibility Score:", accessibility_score)
     # print("Accessibility Results:", json.dumps(accessibility_results, indent=4))
 
     name = extract_company_name(soup, validated_url)
     print(f"Extracted company name: {name}")
 
-    # score, strategy_review_result = await strategy_review_analyzer.analyze(dummy_company_facts["name"], validated_url, soup, all_text)
+    # score, strategy_review_result = await strategy_review_analyzer.analyze(dummy_company_facts["name"], validated_url, soup, all_text, html_bytes)
     # print("Strategy Review Score:", score)
     # print("Strategy Review Results:", json.dumps(strategy_review_result, indent=4))
 
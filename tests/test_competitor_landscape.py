@@ -0,0 +1,52 @@
+import pytest
+
+from app.services.analysis.competitor_landscape import CompetitorLandscapeAnalyzer
+
+
+@pytest.fixture
+def analyzer():
+    return CompetitorLandscapeAnalyzer()
+
+
+@pytest.mark.parametrize("company_name, competitors, expected", [
+    ("Acme Inc.", ["Acme", "Beta"], (100, True)),
+    ("Acme", ["Beta", "Acme, Inc"], (80, True)),
+    ("Open-AI", ["Anthropic", "Google", "OpenAI"], (60, True)),
+    ("Acme", ["Beta", "Gamma", "Delta", "Acme Cloud (acme.io)"], (40, True)),
+])
+def test_calculate_score_matches_name_variants(analyzer, company_name, competitors, expected):
+    assert analyzer._calculate_score(competitors, company_name) == expected
+
+
+@pytest.mark.parametrize("company_name, competitors", [
+    ("X Corp", ["Xerox", "SpaceX", "Box"]),
+    ("Box", ["Dropbox", "Boxed Wholesale"]),
+    ("AI", ["OpenAI", "Mistral AIs"]),
+    ("", ["Acme"]),
+])
+def test_calculate_score_rejects_partial_word_matches(analyzer, company_name, competitors):
+    assert analyzer._calculate_score(competitors, company_name) == (0, False)
+
+
+def test_calculate_score_keeps_short_names_on_word_boundaries(analyzer):
+    assert analyzer._calculate_score(["Xerox", "X (formerly Twitter)"], "X Corp") == (80, True)
+
+
+def test_tally_groups_similar_names_across_providers():
+    llm_responses = {
+        "openai": {"gpt": '{"competitors": ["Acme Inc.", "Beta", "Gamma"]}'},
+        "anthropic": {"claude": '{"competitors": ["Acme Cloud", "Delta"]}', "haiku": '{"competitors": ["acme"]}'},
+        "gemini": {"flash": "Error: timeout"},
+    }
+    counter, ranked = CompetitorLandscapeAnalyzer._tally(llm_responses)
+    assert ranked[0] == ("acme", 2)
+    assert counter["beta"] == 1 and counter["delta"] == 1
+
+
+def test_tally_keeps_short_names_apart():
+    llm_responses = {
+        "openai": {"gpt": '{"competitors": ["X"]}'},
+        "anthropic": {"claude": '{"competitors": ["Xerox"]}'},
+    }
+    _, ranked = CompetitorLandscapeAnalyzer._tally(llm_responses)
+    assert sorted(ranked) == [("x", 1), ("xerox", 1)]
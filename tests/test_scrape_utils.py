@@ -0,0 +1,84 @@
+import asyncio
+
+import httpx
+import pytest
+
+from app.services.analysis.utils import scrape_utils
+
+
+FULL_PAGE = "<html><body><main>" + "<p>Acme builds rockets for everyone.</p>" * 200 + "</main></body></html>"
+STUB_PAGE = "<html><body>Redirecting...</body></html>"
+SHORT_PAGE = "<html><body><p>Hello from Acme</p></body></html>"
+
+
+@pytest.fixture
+def serve(monkeypatch):
+    """Route scrape_website's HTTP client to a handler and record the hosts it requested."""
+    requested = []
+
+    def install(pages):
+        def handler(request):
+            requested.append(request.url.host)
+            status, text = pages.get(request.url.host, (404, "not found"))
+            return httpx.Response(status, text=text, headers={"content-type": "text/html"})
+
+        real_client = httpx.AsyncClient
+
+        def client_factory(**kwargs):
+            kwargs.pop("limits", None)
+            return real_client(transport=httpx.MockTransport(handler), **kwargs)
+
+        monkeypatch.setattr(scrape_utils.httpx, "AsyncClient", client_factory)
+        scrape_utils._stub_hosts.clear()
+        return requested
+
+    return install
+
+
+def test_stub_page_is_replaced_by_the_alternative(serve):
+    requested = serve({"acme.test": (200, STUB_PAGE), "www.acme.test": (200, FULL_PAGE)})
+    soup, all_text, html_bytes = asyncio.run(scrape_utils.scrape_website("https://acme.test/"))
+    assert "rockets" in all_text
+    assert requested == ["acme.test", "www.acme.test"]
+    assert "acme.test" in scrape_utils._stub_hosts
+
+
+def test_full_page_does_not_request_the_alternative(serve):
+    requested = serve({"acme.test": (200, FULL_PAGE), "www.acme.test": (200, STUB_PAGE)})
+    soup, all_text, html_bytes = asyncio.run(scrape_utils.scrape_website("https://acme.test/"))
+    assert "rockets" in all_text
+    assert requested == ["acme.test"]
+
+
+def test_short_page_that_is_not_a_stub_keeps_the_primary(serve):
+    serve({"acme.test": (200, SHORT_PAGE), "www.acme.test": (200, FULL_PAGE)})
+    soup, all_text, html_bytes = asyncio.run(scrape_utils.scrape_website("https://acme.test/"))
+    assert all_text.strip() == "Hello from Acme"
+
+
+def test_failed_alternative_keeps_the_stub(serve):
+    serve({"acme.test": (200, STUB_PAGE), "www.acme.test": (503, "unavailable")})
+    soup, all_text, html_bytes = asyncio.run(scrape_utils.scrape_website("https://acme.test/"))
+    assert html_bytes == STUB_PAGE.encode("utf-8")
+
+
+def test_known_stub_host_requests_both_from_the_start(serve):
+    requested = serve({"acme.test": (200, STUB_PAGE), "www.acme.test": (200, FULL_PAGE)})
+    scrape_utils._stub_hosts["acme.test"] = True
+    soup, all_text, html_bytes = asyncio.run(scrape_utils.scrape_website("https://acme.test/"))
+    assert "rockets" in all_text
+    assert sorted(requested) == ["acme.test", "www.acme.test"]
+
+
+def test_company_facts_cache_opens_on_first_use(monkeypatch, tmp_path):
+    cache_dir = tmp_path / "facts"
+    scrape_utils.close_company_facts_cache()
+    monkeypatch.setattr(scrape_utils.settings, "SCRAPE_CACHE_DIR", str(cache_dir))
+    assert not cache_dir.exists()
+
+    cache = scrape_utils._get_company_facts_cache()
+    assert cache is scrape_utils._get_company_facts_cache()
+    assert cache_dir.exists()
+
+    scrape_utils.close_company_facts_cache()
+    assert scrape_utils._company_facts_cache is None
@@ -0,0 +1,38 @@
+import random
+
+import pytest
+
+from app.services.analysis.strategy_review import StrategyReviewAnalyzer
+
+
+PHRASE_FRAGMENTS = [
+    "yes", "No", "How do I", "what is", "When should", "50%", "3 million", "$30", "€ 12",
+    "half", '"quoted"', "'single'", "[1]", "(Smith 2020)", "über", "naïve", "ça va",
+    "x" * 80, "word", "ok.", "Really?", "Wow!", ". ", "\n", "\t", " ",
+]
+
+
+@pytest.fixture
+def analyzer():
+    return StrategyReviewAnalyzer()
+
+
+def test_joined_phrase_scan_matches_per_phrase_loop(analyzer):
+    """The NUL-joined scan must count exactly what the phrase-by-phrase loop counts."""
+    rng = random.Random(1)
+    for _ in range(3000):
+        text = " ".join(rng.choice(PHRASE_FRAGMENTS) for _ in range(rng.randint(0, 60)))
+        assert analyzer._count_phrase_features(text) == analyzer._count_phrase_features_per_phrase(text), text
+
+
+def test_phrase_scan_counts_a_phrase_once_per_category(analyzer):
+    counts = analyzer._count_phrase_features('Yes, what is it? No. "A" [1] (Smith 2020) and "B". 50% of $30.')
+    assert counts.total_phrases == 4
+    assert counts.is_conversational_phrase == 2
+    assert counts.has_citation_phrase == 1
+    assert counts.has_statistics_phrase == 1
+
+
+def test_text_containing_nul_uses_the_per_phrase_loop(analyzer):
+    text = "What is this?\x00 Yes. 10 percent."
+    assert analyzer._count_phrase_features(text) == analyzer._count_phrase_features_per_phrase(text)